@@ -1,8 +1,16 @@
 """Performance analysis for Anki decks."""
 
+from bisect import bisect
+from collections import Counter
+
 from ..client import get_anki_client
 from ..models import PerformanceReport, StrugglingCard
 
+# Ease buckets in ascending order with the edges that separate them;
+# bisect over the edges maps an ease factor straight to its bucket label
+_EASE_BUCKETS = ("<1.5", "1.5-2.0", "2.0-2.5", "2.5-3.0", ">3.0")
+_EASE_EDGES = (1.5, 2.0, 2.5, 3.0)
+
 
 class DeckPerformanceAnalyzer:
     """Analyzes deck performance based on review history and card metrics."""
@@ -112,30 +120,12 @@ class DeckPerformanceAnalyzer:
         Returns:
             Dictionary with counts for each ease bucket
         """
-        distribution = {
-            "<1.5": 0,  # Struggling
-            "1.5-2.0": 0,  # Difficult
-            "2.0-2.5": 0,  # Normal
-            "2.5-3.0": 0,  # Easy
-            ">3.0": 0,  # Very Easy
-        }
-
-        for card in cards:
-            # Anki stores ease as factor * 1000 (e.g., 2500 = 2.5x)
-            ease_factor = card.get("factor", 2500) / 1000.0
-
-            if ease_factor < 1.5:
-                distribution["<1.5"] += 1
-            elif ease_factor < 2.0:
-                distribution["1.5-2.0"] += 1
-            elif ease_factor < 2.5:
-                distribution["2.0-2.5"] += 1
-            elif ease_factor < 3.0:
-                distribution["2.5-3.0"] += 1
-            else:
-                distribution[">3.0"] += 1
-
-        return distribution
+        # Anki stores ease as factor * 1000 (e.g., 2500 = 2.5x); bisect maps
+        # each value to its bucket without a branch chain per card
+        counts = Counter(
+            _EASE_BUCKETS[bisect(_EASE_EDGES, card.get("factor", 2500) / 1000.0)] for card in cards
+        )
+        return {bucket: counts[bucket] for bucket in _EASE_BUCKETS}
 
     def _calculate_lapse_rate(self, cards: list[dict]) -> float:
         """Calculate percentage of cards with lapses.
@@ -1,6 +1,8 @@
 """Quality analysis for Anki decks."""
 
+import asyncio
 import random
+from array import array
 from collections import Counter
 
 from ..client import get_anki_client
@@ -50,7 +52,7 @@ class DeckQualityAnalyzer:
                     html_usage_percent=0.0,
                     avg_field_length=0.0,
                 ),
-                problematic_card_ids=[],
+                problematic_card_ids=array("q"),
             )
 
         # Sample if requested
@@ -62,22 +64,12 @@ class DeckQualityAnalyzer:
         note_ids = list({card["note"] for card in cards_info})
         notes_info = await self.client.notes_info(note_ids)
 
-        # Validate each card
-        validation_results = []
-        problematic_card_ids = []
-
-        for note in notes_info:
-            card_obj = self._convert_note_to_card(note)
-            if card_obj:
-                results = self.validator.validate(card_obj)
-                validation_results.append((note["noteId"], results))
-
-                # Track problematic cards (any errors or warnings)
-                if any(
-                    r.severity in [ValidationSeverity.ERROR, ValidationSeverity.WARNING]
-                    for r in results
-                ):
-                    problematic_card_ids.append(note["noteId"])
+        # Validate each card off the event loop: rule checks are pure CPU
+        # (regex scans, length checks) and a large deck would otherwise
+        # stall every other tool for the duration
+        validation_results, problematic_card_ids = await asyncio.to_thread(
+            self._validate_notes, notes_info
+        )
 
         # Analyze deck-level patterns
         deck_patterns = self._analyze_deck_patterns(notes_info)
@@ -100,6 +92,62 @@ class DeckQualityAnalyzer:
             problematic_card_ids=problematic_card_ids,
         )
 
+    def _validate_notes(self, notes_info: list[dict]) -> tuple[list[tuple[int, list]], array]:
+        """Validate every note in one synchronous pass.
+
+        Runs in a worker thread via asyncio.to_thread so validation of a
+        large deck does not block the event loop.
+
+        Args:
+            notes_info: List of note info dicts from AnkiConnect
+
+        Returns:
+            Tuple of (validation_results, problematic_card_ids) where
+            validation_results holds (note_id, results) pairs and
+            problematic_card_ids the notes with errors or warnings
+        """
+        validation_results = []
+        problematic_card_ids = array("q")
+
+        # Identical content validates identically, and duplicate notes
+        # (template-generated fronts, re-imported cards) are common, so
+        # memoize per unique content key and skip both the model conversion
+        # and the rule scans on repeats. Results are frozen models, safe to
+        # share; the memo lives per call so memory stays bounded by the run.
+        memo: dict[tuple, tuple[list, bool] | None] = {}
+
+        for note in notes_info:
+            key = (
+                note.get("modelName", ""),
+                tuple(
+                    (name, data.get("value", "")) for name, data in note.get("fields", {}).items()
+                ),
+                tuple(note.get("tags", [])),
+            )
+            if key in memo:
+                cached = memo[key]
+                if cached is None:
+                    continue
+                results, problematic = cached
+            else:
+                card_obj = self._convert_note_to_card(note)
+                if card_obj is None:
+                    memo[key] = None
+                    continue
+                results = self.validator.validate(card_obj)
+                # Problematic means any errors or warnings
+                problematic = any(
+                    r.severity in [ValidationSeverity.ERROR, ValidationSeverity.WARNING]
+                    for r in results
+                )
+                memo[key] = (results, problematic)
+
+            validation_results.append((note["noteId"], results))
+            if problematic:
+                problematic_card_ids.append(note["noteId"])
+
+        return validation_results, problematic_card_ids
+
     def _convert_note_to_card(self, note: dict) -> BasicCard | ClozeCard | TypeInCard | None:
         """Convert Anki note to card model for validation.
 
@@ -287,14 +335,11 @@ class DeckQualityAnalyzer:
         Returns:
             List of (issue_type, count) tuples sorted by frequency
         """
-        issue_counter: Counter[str] = Counter()
-
-        for _, results in validation_results:
-            for result in results:
-                # Use the rule name as issue type
-                issue_counter[result.rule] += 1
-
-        # Return top 5
+        # Tally rule names in one C-level Counter pass; most_common(5) then
+        # heap-selects the top entries without sorting the whole tally
+        issue_counter: Counter[str] = Counter(
+            result.rule for _, results in validation_results for result in results
+        )
         return issue_counter.most_common(5)
 
     def format_report(
@@ -315,66 +360,70 @@ class DeckQualityAnalyzer:
             if sample_size and sample_size < report.total_cards
             else ""
         )
-        msg = f'Deck Quality Analysis: "{deck_name}"{sample_text}\n\n'
+        # Build the report as parts and join once - linear instead of
+        # quadratic in the number of appended fragments
+        parts = [f'Deck Quality Analysis: "{deck_name}"{sample_text}\n\n']
 
         # Overall score with interpretation
-        msg += f"Overall Score: {report.score:.1f}/100 "
+        parts.append(f"Overall Score: {report.score:.1f}/100 ")
         if report.score >= 80:
-            msg += "(Excellent)\n"
+            parts.append("(Excellent)\n")
         elif report.score >= 60:
-            msg += "(Good)\n"
+            parts.append("(Good)\n")
         elif report.score >= 40:
-            msg += "(Needs Improvement)\n"
+            parts.append("(Needs Improvement)\n")
         else:
-            msg += "(Poor)\n"
+            parts.append("(Poor)\n")
 
-        msg += f"Total Cards: {report.total_cards}\n\n"
+        parts.append(f"Total Cards: {report.total_cards}\n\n")
 
         # Issue breakdown
-        msg += "Issue Breakdown:\n"
-        msg += f"  Errors: {report.issues_by_severity['error']}\n"
-        msg += f"  Warnings: {report.issues_by_severity['warning']}\n"
-        msg += f"  Suggestions: {report.issues_by_severity['suggestion']}\n\n"
+        parts.append("Issue Breakdown:\n")
+        parts.append(f"  Errors: {report.issues_by_severity['error']}\n")
+        parts.append(f"  Warnings: {report.issues_by_severity['warning']}\n")
+        parts.append(f"  Suggestions: {report.issues_by_severity['suggestion']}\n\n")
 
-        # Top issues
+        # Top issues, with rule names converted to readable format
         if report.top_issues:
-            msg += "Top Issues:\n"
-            for idx, (rule, count) in enumerate(report.top_issues, 1):
-                # Convert rule name to readable format
-                readable_rule = rule.replace("_", " ").title()
-                msg += f"{idx}. {readable_rule}: {count} cards\n"
-            msg += "\n"
+            parts.append("Top Issues:\n")
+            parts.extend(
+                f"{idx}. {rule.replace('_', ' ').title()}: {count} cards\n"
+                for idx, (rule, count) in enumerate(report.top_issues, 1)
+            )
+            parts.append("\n")
 
         # Deck patterns
         patterns = report.deck_patterns
-        msg += "Deck Patterns:\n"
-        msg += f"  Tag Consistency: {patterns.tag_consistency:.0%} "
+        parts.append("Deck Patterns:\n")
+        parts.append(f"  Tag Consistency: {patterns.tag_consistency:.0%} ")
         if patterns.tag_consistency < 0.3:
-            msg += "(Low - consider adding tags)\n"
+            parts.append("(Low - consider adding tags)\n")
         elif patterns.tag_consistency < 0.7:
-            msg += "(Moderate)\n"
+            parts.append("(Moderate)\n")
         else:
-            msg += "(Good)\n"
+            parts.append("(Good)\n")
 
-        msg += f"  HTML Usage: {patterns.html_usage_percent:.0f}% of cards\n"
-        msg += f"  Avg Field Length: {patterns.avg_field_length:.0f} characters\n\n"
+        parts.append(f"  HTML Usage: {patterns.html_usage_percent:.0f}% of cards\n")
+        parts.append(f"  Avg Field Length: {patterns.avg_field_length:.0f} characters\n\n")
 
         # Card type distribution
-        msg += "Card Type Distribution:\n"
-        for card_type, ratio in patterns.type_distribution.items():
-            msg += f"  {card_type}: {ratio:.0%}\n"
+        parts.append("Card Type Distribution:\n")
+        parts.extend(
+            f"  {card_type}: {ratio:.0%}\n"
+            for card_type, ratio in patterns.type_distribution.items()
+        )
 
         # Check for type imbalance
         if patterns.type_distribution:
             max_ratio = max(patterns.type_distribution.values())
             if max_ratio > 0.8:
-                msg += "\n⚠ Deck heavily uses one card type - consider diversifying\n"
+                parts.append("\n⚠ Deck heavily uses one card type - consider diversifying\n")
 
         # Next steps
-        msg += "\nNext Steps:\n"
+        parts.append("\nNext Steps:\n")
         if report.score < 60:
-            msg += "- Use get_deck_recommendations for prioritized improvement plan\n"
-        msg += "- Use inspect_card(note_id) to review specific problematic cards\n"
-        msg += "- Use analyze_deck_performance to correlate with study metrics\n"
+            parts.append("- Use get_deck_recommendations for prioritized improvement plan\n")
+        parts.append("- Use inspect_card(note_id) to review specific problematic cards\n")
+        parts.append("- Use analyze_deck_performance to correlate with study metrics\n")
 
-        return msg.strip()
+        return "".join(parts).strip()
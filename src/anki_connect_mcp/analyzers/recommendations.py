@@ -1,5 +1,7 @@
 """Recommendation engine for deck improvements."""
 
+from array import array
+
 from ..models import PerformanceReport, QualityReport, Recommendation
 
 
@@ -162,7 +164,9 @@ class RecommendationEngine:
                         f"These {count} cards have ease <1.5 or lapses >2. "
                         "They likely need clarification, splitting, or simplification."
                     ),
-                    affected_card_ids=[card.note_id for card in report.struggling_cards],
+                    affected_card_ids=array(
+                        "q", (card.note_id for card in report.struggling_cards)
+                    ),
                 )
             )
 
@@ -206,9 +210,9 @@ class RecommendationEngine:
 
         # Find struggling cards that also have quality issues
         struggling_note_ids = {card.note_id for card in performance_report.struggling_cards}
-        struggling_with_issues = [
-            nid for nid in quality_report.problematic_card_ids if nid in struggling_note_ids
-        ]
+        struggling_with_issues = array(
+            "q", (nid for nid in quality_report.problematic_card_ids if nid in struggling_note_ids)
+        )
 
         if struggling_with_issues:
             recs.append(
@@ -292,13 +296,18 @@ class RecommendationEngine:
             Formatted recommendations text
         """
         if not recommendations:
-            msg = f'Deck Recommendations: "{deck_name}"\n\n'
-            msg += "No recommendations - deck is in good shape!\n\n"
-            msg += "Continue studying and run periodic analyses to maintain quality."
-            return msg
+            return (
+                f'Deck Recommendations: "{deck_name}"\n\n'
+                "No recommendations - deck is in good shape!\n\n"
+                "Continue studying and run periodic analyses to maintain quality."
+            )
 
-        msg = f'Deck Recommendations: "{deck_name}"\n'
-        msg += f"Generated {len(recommendations)} prioritized recommendations\n\n"
+        # Build the report as parts and join once - linear instead of
+        # quadratic in the number of appended fragments
+        parts = [
+            f'Deck Recommendations: "{deck_name}"\n',
+            f"Generated {len(recommendations)} prioritized recommendations\n\n",
+        ]
 
         # Group by priority tiers
         quick_wins = [r for r in recommendations if r.priority_score >= 5.0]
@@ -306,38 +315,45 @@ class RecommendationEngine:
         consider = [r for r in recommendations if r.priority_score < 2.0]
 
         if quick_wins:
-            msg += "=== QUICK WINS (High Impact, Low Effort) ===\n\n"
-            for idx, rec in enumerate(quick_wins, 1):
-                msg += self._format_recommendation(idx, rec)
+            parts.append("=== QUICK WINS (High Impact, Low Effort) ===\n\n")
+            parts.extend(
+                self._format_recommendation(idx, rec) for idx, rec in enumerate(quick_wins, 1)
+            )
 
         if schedule_soon:
-            msg += "\n=== SCHEDULE SOON (Good Impact/Effort Ratio) ===\n\n"
-            for idx, rec in enumerate(schedule_soon, len(quick_wins) + 1):
-                msg += self._format_recommendation(idx, rec)
+            parts.append("\n=== SCHEDULE SOON (Good Impact/Effort Ratio) ===\n\n")
+            parts.extend(
+                self._format_recommendation(idx, rec)
+                for idx, rec in enumerate(schedule_soon, len(quick_wins) + 1)
+            )
 
         if consider:
-            msg += "\n=== CONSIDER (Lower Priority) ===\n\n"
-            for idx, rec in enumerate(consider, len(quick_wins) + len(schedule_soon) + 1):
-                msg += self._format_recommendation(idx, rec)
+            parts.append("\n=== CONSIDER (Lower Priority) ===\n\n")
+            parts.extend(
+                self._format_recommendation(idx, rec)
+                for idx, rec in enumerate(consider, len(quick_wins) + len(schedule_soon) + 1)
+            )
 
         # Add tracking note
-        msg += "\n=== TRACK PROGRESS ===\n"
-        msg += "Run this analysis monthly to track improvements.\n"
-        msg += "Use inspect_card(note_id) to examine specific cards.\n"
+        parts.append("\n=== TRACK PROGRESS ===\n")
+        parts.append("Run this analysis monthly to track improvements.\n")
+        parts.append("Use inspect_card(note_id) to examine specific cards.\n")
 
-        return msg.strip()
+        return "".join(parts).strip()
 
     def _format_recommendation(self, idx: int, rec: Recommendation) -> str:
         """Format a single recommendation."""
-        msg = f"{idx}. {rec.title} [Priority: {rec.priority_score:.1f}]\n"
-        msg += f"   Impact: {rec.impact.title()} | Effort: {rec.effort.title()}\n"
-        msg += f"   {rec.description}\n"
+        lines = [
+            f"{idx}. {rec.title} [Priority: {rec.priority_score:.1f}]\n",
+            f"   Impact: {rec.impact.title()} | Effort: {rec.effort.title()}\n",
+            f"   {rec.description}\n",
+        ]
 
         if rec.affected_card_ids:
-            msg += f"   Affected cards: {len(rec.affected_card_ids)}\n"
+            lines.append(f"   Affected cards: {len(rec.affected_card_ids)}\n")
 
         if rec.example_before_after:
-            msg += f"   {rec.example_before_after}\n"
+            lines.append(f"   {rec.example_before_after}\n")
 
-        msg += "\n"
-        return msg
+        lines.append("\n")
+        return "".join(lines)
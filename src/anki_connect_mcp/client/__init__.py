@@ -1,5 +1,5 @@
 """AnkiConnect client module."""
 
-from .anki_client import AnkiClient, AnkiConnectionError, get_anki_client
+from .anki_client import AnkiAPIError, AnkiClient, AnkiConnectionError, get_anki_client
 
-__all__ = ["AnkiClient", "AnkiConnectionError", "get_anki_client"]
+__all__ = ["AnkiAPIError", "AnkiClient", "AnkiConnectionError", "get_anki_client"]
@@ -1,11 +1,25 @@
 """AnkiConnect HTTP client with singleton pattern."""
 
+import json
+import time
+from functools import partial
 from typing import Any
 
 import httpx
 
 from ..config import settings
 
+# Compact separators and raw UTF-8 keep request bodies as small as the
+# stdlib encoder can make them; for addNotes batches the payload grows
+# linearly with the card count, so the savings compound
+_dumps = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Deck names change rarely but are requested by nearly every tool call for
+# existence checks, so a short TTL cache turns those repeated roundtrips into
+# a memory lookup. Mutating operations invalidate the cache immediately.
+_DECK_NAMES_TTL_SECONDS = 30.0
+
 
 class AnkiConnectionError(Exception):
     """Raised when unable to connect to AnkiConnect."""
@@ -27,6 +41,38 @@ class AnkiClient:
         """
         self.url = url or settings.anki_connect_url
         self.version = version or settings.anki_connect_version
+        # (fetched_at, names, lowercased names, sorted names, name set), or
+        # None when the cache is cold/invalidated. The lowered copy is
+        # precomputed once per fetch so suggest_decks matches without
+        # re-lowering per call, the sorted copy so repeated listings skip
+        # the O(N log N) sort, and the set so has_deck checks membership
+        # in O(1) instead of scanning the list.
+        self._deck_names_cache: (
+            tuple[float, list[str], list[str], list[str], frozenset[str]] | None
+        ) = None
+        # Pooled HTTP client shared by every invoke, created lazily so it
+        # binds to the serving event loop rather than whichever loop (if
+        # any) is running at construction time
+        self._http: httpx.AsyncClient | None = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the shared pooled HTTP client, creating it on first use.
+
+        A fresh AsyncClient per request pays TCP setup and connection-pool
+        construction every call; keeping one client with keepalive means
+        consecutive invokes reuse the same socket to AnkiConnect.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                limits=httpx.Limits(max_keepalive_connections=8, keepalive_expiry=120.0),
+                timeout=30.0,
+            )
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client, if one was created."""
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
 
     async def invoke(self, action: str, params: dict[str, Any] | None = None) -> Any:
         """Call AnkiConnect API action.
@@ -44,22 +90,38 @@ class AnkiClient:
         """
         payload = {"action": action, "version": self.version, "params": params or {}}
 
-        async with httpx.AsyncClient() as client:
-            try:
-                response = await client.post(self.url, json=payload, timeout=30.0)
-                response.raise_for_status()
-                result = response.json()
+        try:
+            response = await self._http_client().post(
+                self.url, content=_dumps(payload).encode(), headers=_JSON_HEADERS
+            )
+            response.raise_for_status()
+            result = response.json()
+
+            if result.get("error"):
+                raise AnkiAPIError(result["error"])
 
-                if result.get("error"):
-                    raise AnkiAPIError(result["error"])
+            return result.get("result")
 
-                return result.get("result")
+        except httpx.HTTPError as e:
+            raise AnkiConnectionError(
+                f"Failed to connect to AnkiConnect at {self.url}. "
+                f"Is Anki running with AnkiConnect installed? Error: {e}"
+            ) from e
 
-            except httpx.HTTPError as e:
-                raise AnkiConnectionError(
-                    f"Failed to connect to AnkiConnect at {self.url}. "
-                    f"Is Anki running with AnkiConnect installed? Error: {e}"
-                ) from e
+    async def multi(self, actions: list[dict]) -> list[Any]:
+        """Run several actions in one HTTP round trip via the multi action.
+
+        Args:
+            actions: Action dicts, each with "action" and optional "params"
+
+        Returns:
+            Per-action results in order; each entry is the sub-action's
+            {"result": ..., "error": ...} envelope
+
+        Raises:
+            AnkiConnectionError: Connection failed
+        """
+        return await self.invoke("multi", {"actions": actions})
 
     # Note operations
     async def add_note(self, note: dict) -> int:
@@ -75,6 +137,8 @@ class AnkiClient:
             AnkiConnectionError: Connection failed
             AnkiAPIError: Note creation failed
         """
+        # Adding a note can implicitly create its target deck
+        self._deck_names_cache = None
         return await self.invoke("addNote", {"note": note})
 
     async def add_notes(self, notes: list[dict]) -> list[int | None]:
@@ -89,6 +153,7 @@ class AnkiClient:
         Raises:
             AnkiConnectionError: Connection failed
         """
+        self._deck_names_cache = None
         return await self.invoke("addNotes", {"notes": notes})
 
     async def update_note_fields(self, note_id: int, fields: dict[str, str]) -> None:
@@ -142,7 +207,74 @@ class AnkiClient:
         Raises:
             AnkiConnectionError: Connection failed
         """
-        return await self.invoke("deckNames")
+        cached = self._deck_names_cache
+        if cached is not None and time.monotonic() - cached[0] < _DECK_NAMES_TTL_SECONDS:
+            return cached[1]
+
+        names = await self.invoke("deckNames")
+        self._deck_names_cache = (
+            time.monotonic(),
+            names,
+            [n.lower() for n in names],
+            sorted(names),
+            frozenset(names),
+        )
+        return names
+
+    async def deck_names_sorted(self) -> list[str]:
+        """Get all deck names in alphabetical order.
+
+        Returns:
+            Sorted list of deck names
+
+        Raises:
+            AnkiConnectionError: Connection failed
+        """
+        await self.deck_names()  # populate/refresh the cache
+        assert self._deck_names_cache is not None
+        return self._deck_names_cache[3]
+
+    async def has_deck(self, name: str) -> bool:
+        """Check whether a deck exists, by exact name.
+
+        Args:
+            name: Deck name to look up
+
+        Returns:
+            True if the deck exists
+
+        Raises:
+            AnkiConnectionError: Connection failed
+        """
+        await self.deck_names()  # populate/refresh the cache
+        assert self._deck_names_cache is not None
+        return name in self._deck_names_cache[4]
+
+    async def suggest_decks(self, partial: str, limit: int = 5) -> list[str]:
+        """Suggest deck names containing partial, case-insensitively.
+
+        Args:
+            partial: Substring to match against deck names
+            limit: Maximum number of suggestions
+
+        Returns:
+            Up to limit matching deck names
+
+        Raises:
+            AnkiConnectionError: Connection failed
+        """
+        await self.deck_names()  # populate/refresh the cache
+        assert self._deck_names_cache is not None
+        _, names, lowered, _, _ = self._deck_names_cache
+
+        needle = partial.lower()
+        suggestions = []
+        for name, low in zip(names, lowered):
+            if needle in low:
+                suggestions.append(name)
+                if len(suggestions) == limit:
+                    break
+        return suggestions
 
     async def deck_names_and_ids(self) -> dict[str, int]:
         """Get deck names mapped to IDs.
@@ -167,8 +299,47 @@ class AnkiClient:
         Raises:
             AnkiConnectionError: Connection failed
         """
+        self._deck_names_cache = None
         return await self.invoke("createDeck", {"deck": name})
 
+    async def create_deck_with_names(self, name: str) -> tuple[list[str], int]:
+        """Create a deck and read the prior deck list in one round trip.
+
+        Bundles deckNames and createDeck into a single multi action so
+        callers that need an existed-already check don't pay a second HTTP
+        round trip. createDeck on an existing name is a no-op that returns
+        the existing deck's ID, so running it unconditionally is safe; the
+        names list is read before the create, letting the caller detect
+        the duplicate case.
+
+        Args:
+            name: Deck name (supports hierarchy with ::)
+
+        Returns:
+            Tuple of (deck names before the create, deck ID)
+
+        Raises:
+            AnkiConnectionError: Connection failed
+            AnkiAPIError: Either sub-action returned an error
+        """
+        self._deck_names_cache = None
+        results = await self.multi(
+            [
+                {"action": "deckNames"},
+                {"action": "createDeck", "params": {"deck": name}},
+            ]
+        )
+        # multi wraps each sub-result in a {"result", "error"} envelope that
+        # invoke() does not inspect; raise here as invoke() would for a
+        # standalone call instead of returning None as the deck ID
+        for entry in results:
+            if isinstance(entry, dict) and entry.get("error"):
+                raise AnkiAPIError(entry["error"])
+        names_entry, deck_entry = results
+        names: list[str] = names_entry["result"] if isinstance(names_entry, dict) else names_entry
+        deck_id: int = deck_entry["result"] if isinstance(deck_entry, dict) else deck_entry
+        return names, deck_id
+
     async def delete_decks(self, deck_names: list[str], cards_too: bool = False) -> None:
         """Delete decks.
 
@@ -179,6 +350,7 @@ class AnkiClient:
         Raises:
             AnkiConnectionError: Connection failed
         """
+        self._deck_names_cache = None
         await self.invoke("deleteDecks", {"decks": deck_names, "cardsToo": cards_too})
 
     async def get_deck_stats(self, deck_name: str) -> dict:
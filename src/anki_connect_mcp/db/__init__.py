@@ -1,5 +1,5 @@
 """Database module for card generation history tracking."""
 
-from .database import Database, get_database, get_db_connection
+from .database import Database, get_background_database, get_database, get_db_connection
 
-__all__ = ["Database", "get_database", "get_db_connection"]
+__all__ = ["Database", "get_background_database", "get_database", "get_db_connection"]
@@ -1,12 +1,19 @@
 """DuckDB database for tracking card generation history."""
 
 import json
+from collections.abc import Iterator
+from functools import partial
 from pathlib import Path
 
 import duckdb
 
 from ..config import settings
 
+# Shared encoder for every JSON column: compact separators skip the
+# space-padding work and shrink stored rows, and ensure_ascii=False writes
+# non-ASCII text directly instead of \u-escaping each character
+_dumps = partial(json.dumps, separators=(",", ":"), ensure_ascii=False)
+
 
 class Database:
     """DuckDB database manager for card history tracking."""
@@ -32,7 +39,7 @@ class Database:
         Returns:
             Generation ID
         """
-        metadata_json = json.dumps(metadata) if metadata else None
+        metadata_json = _dumps(metadata) if metadata else None
         result = self.conn.execute(
             """
             INSERT INTO generations (source_type, source_path, source_metadata)
@@ -71,8 +78,8 @@ class Database:
         Returns:
             Generated card ID
         """
-        tags_json = json.dumps(tags) if tags else None
-        warnings_json = json.dumps(validation_warnings) if validation_warnings else None
+        tags_json = _dumps(tags) if tags else None
+        warnings_json = _dumps(validation_warnings) if validation_warnings else None
 
         result = self.conn.execute(
             """
@@ -98,6 +105,122 @@ class Database:
             raise RuntimeError("Failed to add generated card")
         return result[0]
 
+    def create_generation_with_card(
+        self,
+        source_type: str,
+        anki_note_id: int,
+        card_type: str,
+        front_or_text: str,
+        back: str | None,
+        deck: str,
+        tags: list[str] | None = None,
+        validation_warnings: list[dict] | None = None,
+        source_path: str | None = None,
+        metadata: dict | None = None,
+    ) -> tuple[int, int]:
+        """Create a generation session and its card in one transaction.
+
+        The single-card tools always insert a generation row immediately
+        followed by its card row; wrapping both in one explicit transaction
+        means DuckDB flushes the WAL once instead of once per statement, and
+        a failure on the card insert rolls back the orphan generation row.
+
+        Args:
+            source_type: Type of source ('pdf', 'epub', 'web', 'text', 'manual')
+            anki_note_id: Anki note ID
+            card_type: Card type ('basic', 'cloze', 'type_in')
+            front_or_text: Front text (or cloze text)
+            back: Back text (None for cloze cards)
+            deck: Deck name
+            tags: List of tags
+            validation_warnings: Validation warnings as JSON
+            source_path: File path or URL of source
+            metadata: Additional generation metadata as JSON
+
+        Returns:
+            Tuple of (generation ID, generated card ID)
+        """
+        self.conn.begin()
+        try:
+            generation_id = self.create_generation(
+                source_type=source_type, source_path=source_path, metadata=metadata
+            )
+            card_id = self.add_generated_card(
+                generation_id=generation_id,
+                anki_note_id=anki_note_id,
+                card_type=card_type,
+                front_or_text=front_or_text,
+                back=back,
+                deck=deck,
+                tags=tags,
+                validation_warnings=validation_warnings,
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return generation_id, card_id
+
+    def create_generation_with_cards(
+        self,
+        source_type: str,
+        cards: list[dict],
+        source_path: str | None = None,
+        metadata: dict | None = None,
+    ) -> int:
+        """Create a generation session and all its cards in one transaction.
+
+        Bulk counterpart to create_generation_with_card: the card rows go
+        through one executemany instead of a statement per card, so a batch
+        of N cards costs one WAL flush rather than N+1.
+
+        Args:
+            source_type: Type of source ('pdf', 'epub', 'web', 'text', 'manual')
+            cards: Card dicts with anki_note_id, card_type, front_or_text,
+                back, deck, and optional tags / validation_warnings keys
+            source_path: File path or URL of source
+            metadata: Additional generation metadata as JSON
+
+        Returns:
+            Generation ID
+        """
+        self.conn.begin()
+        try:
+            generation_id = self.create_generation(
+                source_type=source_type, source_path=source_path, metadata=metadata
+            )
+            self.conn.executemany(
+                """
+                INSERT INTO generated_cards (
+                    generation_id, anki_note_id, card_type,
+                    front_or_text, back, deck, tags, validation_warnings
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                [
+                    [
+                        generation_id,
+                        card["anki_note_id"],
+                        card["card_type"],
+                        card["front_or_text"],
+                        card.get("back"),
+                        card["deck"],
+                        _dumps(card["tags"]) if card.get("tags") else None,
+                        (
+                            _dumps(card["validation_warnings"])
+                            if card.get("validation_warnings")
+                            else None
+                        ),
+                    ]
+                    for card in cards
+                ],
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return generation_id
+
     def get_generation_history(self, source_type: str | None = None, limit: int = 50) -> list[dict]:
         """Get recent generation history.
 
@@ -152,14 +275,19 @@ class Database:
         ]
         return [dict(zip(columns, row)) for row in result]
 
-    def get_cards_by_source(self, source_path: str) -> list[dict]:
-        """Get all cards generated from a specific source.
+    def iter_cards_by_source(self, source_path: str, batch_size: int = 256) -> Iterator[dict]:
+        """Stream cards generated from a specific source.
+
+        The result set for a source is unbounded, so rows are pulled in
+        fetchmany batches instead of one fetchall; callers can format each
+        row as it arrives and peak memory stays bounded by the batch size.
 
         Args:
             source_path: Source file path or URL
+            batch_size: Number of rows fetched per batch
 
-        Returns:
-            List of card records
+        Yields:
+            Card record dicts, most recent first
         """
         query = """
             SELECT
@@ -178,7 +306,7 @@ class Database:
             WHERE g.source_path = ?
             ORDER BY gc.created_at DESC
         """
-        result = self.conn.execute(query, [source_path]).fetchall()
+        cursor = self.conn.execute(query, [source_path])
 
         columns = [
             "id",
@@ -192,7 +320,20 @@ class Database:
             "created_at",
             "source_type",
         ]
-        return [dict(zip(columns, row)) for row in result]
+        while rows := cursor.fetchmany(batch_size):
+            for row in rows:
+                yield dict(zip(columns, row))
+
+    def get_cards_by_source(self, source_path: str) -> list[dict]:
+        """Get all cards generated from a specific source.
+
+        Args:
+            source_path: Source file path or URL
+
+        Returns:
+            List of card records
+        """
+        return list(self.iter_cards_by_source(source_path))
 
     def get_recent_cards(self, limit: int = 50) -> list[dict]:
         """Get recently created cards.
@@ -278,7 +419,7 @@ class Database:
         Returns:
             Analysis ID
         """
-        metadata_json = json.dumps(metadata) if metadata else None
+        metadata_json = _dumps(metadata) if metadata else None
         result = self.conn.execute(
             """
             INSERT INTO deck_analyses
@@ -389,6 +530,52 @@ class Database:
             [anki_note_id, concept_id, relationship],
         )
 
+    def link_cards_to_concepts(self, links: list[dict]) -> int:
+        """Link multiple cards to concepts in one transaction.
+
+        Bulk counterpart to link_card_to_concept: each distinct (deck,
+        concept_name) pair is resolved or created once and the link rows go
+        through one executemany, so a batch of N links costs one commit
+        rather than N.
+
+        Args:
+            links: Link dicts with anki_note_id, concept_name, deck, and
+                optional relationship / concept_description keys
+
+        Returns:
+            Number of links written
+        """
+        self.conn.begin()
+        try:
+            concept_ids: dict[tuple[str, str], int] = {}
+            for link in links:
+                key = (link["deck"], link["concept_name"])
+                if key not in concept_ids:
+                    concept_ids[key] = self.create_or_get_concept(
+                        deck=link["deck"],
+                        name=link["concept_name"],
+                        description=link.get("concept_description"),
+                    )
+            self.conn.executemany(
+                """
+                INSERT OR REPLACE INTO card_concepts (anki_note_id, concept_id, relationship)
+                VALUES (?, ?, ?)
+                """,
+                [
+                    [
+                        link["anki_note_id"],
+                        concept_ids[(link["deck"], link["concept_name"])],
+                        link.get("relationship"),
+                    ]
+                    for link in links
+                ],
+            )
+        except Exception:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+        return len(links)
+
     def get_concept_coverage(self, deck: str) -> list[dict]:
         """Get concepts and their card coverage for a deck.
 
@@ -773,8 +960,9 @@ def _init_schema(conn: duckdb.DuckDBPyConnection) -> None:
     conn.execute("CREATE INDEX IF NOT EXISTS idx_sessions_deck ON sessions(deck, created_at DESC)")
 
 
-# Singleton connection
+# Singleton connection and the Database wrapper bound to it
 _conn: duckdb.DuckDBPyConnection | None = None
+_database: Database | None = None
 
 
 def get_db_connection() -> duckdb.DuckDBPyConnection:
@@ -792,9 +980,27 @@ def get_db_connection() -> duckdb.DuckDBPyConnection:
 
 
 def get_database() -> Database:
-    """Get Database instance with singleton connection.
+    """Get the singleton Database instance.
 
     Returns:
         Database instance
     """
-    return Database(get_db_connection())
+    global _database
+    if _database is None:
+        _database = Database(get_db_connection())
+    return _database
+
+
+def get_background_database() -> Database:
+    """Get a Database bound to a fresh cursor of the singleton connection.
+
+    A DuckDB cursor is an independent connection to the same database with
+    its own transaction context. Background writers must go through this
+    rather than get_database(): their explicit transactions would otherwise
+    overlap those of the shared connection and fail with "cannot start a
+    transaction within a transaction".
+
+    Returns:
+        Database instance with its own transaction context
+    """
+    return Database(get_db_connection().cursor())
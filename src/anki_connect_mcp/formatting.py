@@ -289,10 +289,17 @@ def strip_html(text: str) -> str:
     return text
 
 
+# Matches an HTML tag or entity in a single pass. Entities inside tags are
+# consumed by the tag alternative, so they're never counted twice.
+_TAG_OR_ENTITY_RE = re.compile(r"<[^>]+>|&#?\w+;?")
+
+
 def get_text_length(text: str) -> int:
     """Get the length of text excluding HTML tags.
 
     Useful for validation that should count visible characters only.
+    Computed in a single pass without building the stripped string,
+    so it's cheap to call on every field during validation.
 
     Args:
         text: Text potentially containing HTML
@@ -306,7 +313,79 @@ def get_text_length(text: str) -> int:
         >>> get_text_length("Plain text")
         10
     """
-    return len(strip_html(text))
+    # Fast path: plain text needs no stripping at all
+    if "<" not in text and "&" not in text:
+        return len(text)
+
+    length = len(text)
+    for match in _TAG_OR_ENTITY_RE.finditer(text):
+        token = match.group()
+        if token[0] == "<":
+            # Tags contribute nothing to visible length
+            length -= len(token)
+        else:
+            # Entities decode to (usually) a single character
+            length -= len(token) - len(html.unescape(token))
+    return length
+
+
+# Whitespace-delimited token, for counting words without materializing the
+# token list that str.split() would allocate
+_WORD_RE = re.compile(r"\S+")
+
+
+def count_words(text: str) -> int:
+    """Count whitespace-delimited words in text.
+
+    Equivalent to ``len(text.split())`` without allocating the list of
+    word slices, which matters when counting words in every field of
+    every card.
+
+    Args:
+        text: Plain text to count words in
+
+    Returns:
+        Number of whitespace-delimited tokens
+
+    Example:
+        >>> count_words("one  two three")
+        3
+    """
+    return sum(1 for _ in _WORD_RE.finditer(text))
+
+
+def find_cloze_numbers(text: str) -> list[int]:
+    """Find the numbers of all ``{{cN::`` cloze openers in text.
+
+    A single linear scan using plain string operations - the structural
+    check is simple enough that walking the text directly beats running
+    the regex engine, and this sits on the per-card validation hot path.
+
+    Args:
+        text: Cloze card text
+
+    Returns:
+        Cloze numbers in order of appearance (duplicates preserved)
+
+    Example:
+        >>> find_cloze_numbers("{{c1::Paris}} is in {{c2::France}}.")
+        [1, 2]
+        >>> find_cloze_numbers("no deletions here")
+        []
+    """
+    numbers = []
+    i = 0
+    while (j := text.find("{{c", i)) != -1:
+        k = j + 3
+        while k < len(text) and "0" <= text[k] <= "9":
+            k += 1
+        if k > j + 3 and text.startswith("::", k):
+            numbers.append(int(text[j + 3 : k]))
+            i = k + 2
+        else:
+            # Not an opener (e.g. "{{call..."); resume after the "{{c"
+            i = j + 3
+    return numbers
 
 
 def mathjax_inline(latex: str) -> str:
@@ -493,6 +572,10 @@ def highlight_code_blocks(html_content: str) -> str:
         HTML with code blocks replaced by syntax-highlighted versions.
         Returns the input unchanged if no code blocks are found.
     """
+    # Fast path: most card fields contain no code block at all, and a
+    # substring check is far cheaper than running the DOTALL pattern
+    if "<pre><code" not in html_content:
+        return html_content
 
     def _replace_match(m: re.Match[str]) -> str:
         language = m.group(1)
@@ -519,6 +602,8 @@ __all__ = [
     "div",
     "strip_html",
     "get_text_length",
+    "count_words",
+    "find_cloze_numbers",
     "mathjax_inline",
     "mathjax_block",
     "highlight_code",
@@ -1,8 +1,75 @@
 """Pydantic models for cards, validation results, and data structures."""
 
-from enum import Enum
+from array import array
+from dataclasses import dataclass, field
+from enum import Enum, IntEnum
+from typing import Self
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    field_serializer,
+    field_validator,
+)
+
+
+class _Base(BaseModel):
+    """Shared base that defers schema building until first use.
+
+    Building a model's core schema at import time costs startup latency and
+    memory for every model, including ones a session never touches. Deferring
+    means each model only pays that cost on its first validation.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class _CardBase(_Base):
+    """Shared base for the validated card models.
+
+    Card batches repeat the same handful of field names ("front", "back",
+    "tags", "deck") across every card, so cache_strings lets pydantic-core
+    intern them once per validation run instead of allocating fresh string
+    objects per card. Cards are never mutated after construction, so
+    frozen=True also lets pydantic-core skip its setter guards. Whitespace
+    stripping happens in pydantic-core via str_strip_whitespace rather than
+    per-field Python validators.
+    """
+
+    model_config = ConfigDict(
+        defer_build=True, cache_strings="all", frozen=True, str_strip_whitespace=True
+    )
+
+    @field_validator("tags", check_fields=False)
+    @classmethod
+    def _dedupe_tags(cls, tags: list[str]) -> list[str]:
+        """Drop duplicate tags once at construction, preserving order.
+
+        The tags list is forwarded verbatim to AnkiConnect and to the
+        history database, so normalizing here means no downstream consumer
+        ever needs its own dedup pass.
+        """
+        return list(dict.fromkeys(tags))
+
+    @classmethod
+    def from_trusted_row(cls, row: dict) -> Self:
+        """Build a card from an already-validated row, skipping validation.
 
-from pydantic import BaseModel, Field, field_validator
+        model_construct bypasses field constraints and whitespace
+        stripping, which is correct only for rows that round-trip from our
+        own database - they passed full validation when the card was
+        created. External (LLM-supplied) data must still go through the
+        normal constructor or model_validate.
+
+        Args:
+            row: Mapping of field names to stored values
+
+        Returns:
+            Card instance built without re-validation
+        """
+        return cls.model_construct(**row)
 
 
 class CardType(str, Enum):
@@ -21,16 +88,46 @@ class ValidationSeverity(str, Enum):
     SUGGESTION = "suggestion"  # Best practice tip
 
 
-class ValidationResult(BaseModel):
+class CardField(IntEnum):
+    """Card fields that validation rules can flag.
+
+    Batch validation produces thousands of ValidationResults, each naming a
+    field; a small IntEnum keeps that attribute one shared member per field
+    instead of a string object, and field comparisons become int compares.
+    """
+
+    FRONT = 0
+    BACK = 1
+    TEXT = 2
+    EXTRA = 3
+    TAGS = 4
+    DECK = 5
+
+
+# Field names indexed by CardField value, for O(1) stringification on output
+_FIELD_NAMES = ("front", "back", "text", "extra", "tags", "deck")
+
+
+class ValidationResult(_Base):
     """Result from a single validation rule."""
 
+    # Results are emitted once by a rule and only ever read afterwards;
+    # frozen lets pydantic-core skip setter guards and makes any cached
+    # serialization of a result safe to share
+    model_config = ConfigDict(defer_build=True, frozen=True)
+
     severity: ValidationSeverity
     rule: str = Field(description="Name of the validation rule")
     message: str = Field(description="Human-readable validation message")
-    field: str | None = Field(default=None, description="Field that failed validation")
+    field: CardField | None = Field(default=None, description="Field that failed validation")
+
+    @field_serializer("field")
+    def _field_as_name(self, value: CardField | None) -> str | None:
+        """Serialize the field back to its lowercase name for MCP output."""
+        return None if value is None else _FIELD_NAMES[value]
 
 
-class BasicCard(BaseModel):
+class BasicCard(_CardBase):
     """Basic flashcard with front and back."""
 
     front: str = Field(min_length=1, max_length=1000, description="Question or prompt")
@@ -38,14 +135,8 @@ class BasicCard(BaseModel):
     tags: list[str] = Field(default_factory=list, description="Tags for the card")
     deck: str | None = Field(default=None, description="Deck name (uses default if not provided)")
 
-    @field_validator("front", "back")
-    @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        """Strip leading/trailing whitespace."""
-        return v.strip()
-
 
-class ClozeCard(BaseModel):
+class ClozeCard(_CardBase):
     """Cloze deletion card."""
 
     text: str = Field(min_length=1, description="Text with cloze deletions in {{c1::text}} format")
@@ -53,14 +144,8 @@ class ClozeCard(BaseModel):
     deck: str | None = Field(default=None, description="Deck name (uses default if not provided)")
     extra: str | None = Field(default=None, description="Additional context/hints")
 
-    @field_validator("text")
-    @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        """Strip leading/trailing whitespace."""
-        return v.strip()
 
-
-class TypeInCard(BaseModel):
+class TypeInCard(_CardBase):
     """Type-in answer card (tests exact typing)."""
 
     front: str = Field(min_length=1, max_length=1000, description="Question or prompt")
@@ -68,14 +153,8 @@ class TypeInCard(BaseModel):
     tags: list[str] = Field(default_factory=list, description="Tags for the card")
     deck: str | None = Field(default=None, description="Deck name (uses default if not provided)")
 
-    @field_validator("front", "back")
-    @classmethod
-    def strip_whitespace(cls, v: str) -> str:
-        """Strip leading/trailing whitespace."""
-        return v.strip()
 
-
-class CardBatch(BaseModel):
+class CardBatch(_Base):
     """Batch of cards for preview/creation."""
 
     cards: list[dict] = Field(description="List of card dictionaries")
@@ -83,74 +162,118 @@ class CardBatch(BaseModel):
     source: str | None = Field(default=None, description="Source (PDF filename, URL, etc.)")
 
 
+# Shared list adapters, built once at module scope. Instantiating a
+# TypeAdapter per batch would rebuild its validator and serializer on every
+# call; with defer_build these compile lazily on first use and are reused.
+BASIC_LIST_ADAPTER = TypeAdapter(list[BasicCard])
+CLOZE_LIST_ADAPTER = TypeAdapter(list[ClozeCard])
+TYPEIN_LIST_ADAPTER = TypeAdapter(list[TypeInCard])
+
+_LIST_ADAPTERS: dict[CardType, TypeAdapter] = {
+    CardType.BASIC: BASIC_LIST_ADAPTER,
+    CardType.CLOZE: CLOZE_LIST_ADAPTER,
+    CardType.TYPE_IN: TYPEIN_LIST_ADAPTER,
+}
+
+
+def validate_card_batch(batch: CardBatch) -> list[BasicCard | ClozeCard | TypeInCard]:
+    """Validate a batch's raw card dicts into typed card models.
+
+    Each dict in ``batch.cards`` must carry a ``card_type`` key matching a
+    CardType value; remaining keys are the card fields. Cards are grouped by
+    type and validated through the shared module-level adapters.
+
+    Args:
+        batch: Batch of raw card dictionaries
+
+    Returns:
+        Validated card models in the original batch order
+
+    Raises:
+        ValueError: A card is missing ``card_type`` or has an unknown type
+        pydantic.ValidationError: A card's fields fail validation
+    """
+    by_type: dict[CardType, list[tuple[int, dict]]] = {}
+    for index, raw in enumerate(batch.cards):
+        try:
+            card_type = CardType(raw.get("card_type", CardType.BASIC))
+        except ValueError:
+            raise ValueError(f"Card {index}: unknown card_type {raw.get('card_type')!r}") from None
+        fields = {k: v for k, v in raw.items() if k != "card_type"}
+        by_type.setdefault(card_type, []).append((index, fields))
+
+    validated: list[tuple[int, BasicCard | ClozeCard | TypeInCard]] = []
+    for card_type, entries in by_type.items():
+        cards = _LIST_ADAPTERS[card_type].validate_python([fields for _, fields in entries])
+        validated.extend((index, card) for (index, _), card in zip(entries, cards))
+
+    validated.sort(key=lambda item: item[0])
+    return [card for _, card in validated]
+
+
 # Deck Analysis Models
+#
+# These are built internally by the analyzers from data we already trust and
+# only ever rendered to text at the MCP boundary, so they skip Pydantic
+# validation entirely: slotted dataclasses are much cheaper to construct and
+# hold when a report covers thousands of cards. Note-ID collections are
+# packed array('q') (8 bytes per id) rather than lists of PyLongs.
 
 
-class DeckPatterns(BaseModel):
+@dataclass(slots=True)
+class DeckPatterns:
     """Deck-level pattern analysis."""
 
-    tag_consistency: float = Field(description="Percentage of cards with tags (0.0-1.0)")
-    type_distribution: dict[str, float] = Field(
-        description="Distribution of card types (e.g., {'Cloze': 0.68, 'Basic': 0.30})"
-    )
-    html_usage_percent: float = Field(description="Percentage of cards using HTML formatting")
-    avg_field_length: float = Field(description="Average field length in characters")
+    tag_consistency: float  # Percentage of cards with tags (0.0-1.0)
+    type_distribution: dict[str, float]  # e.g., {'Cloze': 0.68, 'Basic': 0.30}
+    html_usage_percent: float  # Percentage of cards using HTML formatting
+    avg_field_length: float  # Average field length in characters
 
 
-class QualityReport(BaseModel):
+@dataclass(slots=True)
+class QualityReport:
     """Quality analysis report for a deck."""
 
-    score: float = Field(description="Quality score (0-100)")
-    total_cards: int = Field(description="Total number of cards analyzed")
-    issues_by_severity: dict[str, int] = Field(
-        description="Count of issues by severity (error/warning/suggestion)"
-    )
-    top_issues: list[tuple[str, int]] = Field(
-        description="Top 5 most common issues as (issue_type, count) tuples"
-    )
-    deck_patterns: DeckPatterns = Field(description="Deck-level pattern analysis")
-    problematic_card_ids: list[int] = Field(
-        description="Note IDs of cards with issues", default_factory=list
+    score: float  # Quality score (0-100)
+    total_cards: int  # Total number of cards analyzed
+    issues_by_severity: dict[str, int]  # Counts keyed by error/warning/suggestion
+    top_issues: list[tuple[str, int]]  # Top 5 issues as (issue_type, count) tuples
+    deck_patterns: DeckPatterns
+    problematic_card_ids: array[int] = field(  # Note IDs with issues, packed int64
+        default_factory=lambda: array("q")
     )
 
 
-class StrugglingCard(BaseModel):
+@dataclass(slots=True)
+class StrugglingCard:
     """Card with performance issues."""
 
-    note_id: int = Field(description="Anki note ID")
-    ease: float = Field(description="Ease factor (e.g., 2.5 = 250%)")
-    lapses: int = Field(description="Number of times card lapsed")
-    interval_days: int = Field(description="Current interval in days")
+    note_id: int  # Anki note ID
+    ease: float  # Ease factor (e.g., 2.5 = 250%)
+    lapses: int  # Number of times card lapsed
+    interval_days: int  # Current interval in days
 
 
-class PerformanceReport(BaseModel):
+@dataclass(slots=True)
+class PerformanceReport:
     """Performance analysis report for a deck."""
 
-    retention_rate: float = Field(description="Retention rate (0.0-1.0)")
-    ease_distribution: dict[str, int] = Field(
-        description="Distribution of cards by ease factor buckets"
-    )
-    lapse_rate: float = Field(description="Percentage of cards with lapses")
-    struggling_cards: list[StrugglingCard] = Field(
-        description="Cards with low ease or high lapses", default_factory=list
-    )
-    maturity_breakdown: dict[str, int] = Field(
-        description="Distribution by maturity (young/mature/very_mature)"
-    )
-    total_reviews: int = Field(description="Total number of reviews analyzed", default=0)
+    retention_rate: float  # Retention rate (0.0-1.0)
+    ease_distribution: dict[str, int]  # Counts by ease factor bucket
+    lapse_rate: float  # Percentage of cards with lapses
+    struggling_cards: list[StrugglingCard] = field(default_factory=list)
+    maturity_breakdown: dict[str, int] = field(default_factory=dict)
+    total_reviews: int = 0  # Total number of reviews analyzed
 
 
-class Recommendation(BaseModel):
+@dataclass(slots=True)
+class Recommendation:
     """Actionable recommendation for deck improvement."""
 
-    title: str = Field(description="Recommendation title")
-    impact: str = Field(description="Impact level: high, medium, or low")
-    effort: str = Field(description="Effort level: quick, moderate, or large")
-    priority_score: float = Field(description="Priority score (impact/effort)")
-    description: str = Field(description="Detailed recommendation description")
-    affected_card_ids: list[int] = Field(
-        description="Note IDs affected by this recommendation", default_factory=list
-    )
-    example_before_after: str | None = Field(
-        default=None, description="Example showing before/after"
-    )
+    title: str
+    impact: str  # Impact level: high, medium, or low
+    effort: str  # Effort level: quick, moderate, or large
+    priority_score: float  # Priority score (impact/effort)
+    description: str
+    affected_card_ids: array[int] = field(default_factory=lambda: array("q"))
+    example_before_after: str | None = None  # Example showing before/after
@@ -1,8 +1,38 @@
 """MCP resources for read-only data access (history, statistics)."""
 
+import sys
+import time
+
 from .db import get_database
 from .server import app
 
+# Section separator used by every resource; computed once at import time
+_SEP = "=" * 80 + "\n"
+
+# Row keys used in the per-row loops below, interned once so every dict
+# lookup takes the cached-hash + pointer-compare fast path
+_K_TYPE = sys.intern("card_type")
+_K_FRONT = sys.intern("front_or_text")
+_K_DECK = sys.intern("deck")
+_K_SOURCE = sys.intern("source_type")
+_K_CREATED = sys.intern("created_at")
+_K_NOTE = sys.intern("anki_note_id")
+_K_BACK = sys.intern("back")
+_K_WARN = sys.intern("validation_warnings")
+
+
+def _truncate(text: str, limit: int) -> str:
+    """Truncate text to limit characters, appending an ellipsis if cut."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
+
+# Aggregation resources change only when new cards are inserted, so a short
+# TTL cache turns repeated reads into a memory lookup instead of a full
+# table scan. Entries are (computed_at, output) pairs.
+_CACHE_TTL_SECONDS = 5.0
+_stats_cache: tuple[float, str] | None = None
+_history_cache: tuple[float, str] | None = None
+
 
 @app.resource("card-history://recent")
 async def card_history() -> str:
@@ -20,26 +50,19 @@ async def card_history() -> str:
     if not cards:
         return "No cards have been created yet."
 
-    # Format as table
-    output = "Recent Card Creation History (50 most recent)\n"
-    output += "=" * 80 + "\n\n"
+    # Build output as parts and join once - linear instead of quadratic
+    parts = ["Recent Card Creation History (50 most recent)\n", _SEP, "\n"]
 
-    for card in cards:
-        card_type = card["card_type"].upper()
-        front_text = (
-            card["front_or_text"][:50] + "..."
-            if len(card["front_or_text"]) > 50
-            else card["front_or_text"]
-        )
-        deck = card["deck"]
-        source = card["source_type"] or "manual"
-        created = card["created_at"]
+    # One f-string per row keeps the hot loop in CPython's format path
+    parts.extend(
+        f"[{card[_K_TYPE].upper()}] {_truncate(card[_K_FRONT], 50)}\n"
+        f"  Deck: {card[_K_DECK]} | Source: {card[_K_SOURCE] or 'manual'}"
+        f" | Created: {card[_K_CREATED]}\n"
+        f"  Anki Note ID: {card[_K_NOTE]}\n\n"
+        for card in cards
+    )
 
-        output += f"[{card_type}] {front_text}\n"
-        output += f"  Deck: {deck} | Source: {source} | Created: {created}\n"
-        output += f"  Anki Note ID: {card['anki_note_id']}\n\n"
-
-    return output
+    return "".join(parts)
 
 
 @app.resource("card-history://source/{source_path}")
@@ -56,41 +79,34 @@ async def cards_by_source(source_path: str) -> str:
         Formatted list of cards from this source
     """
     db = get_database()
-    cards = db.get_cards_by_source(source_path)
 
-    if not cards:
+    # Stream rows in fetchmany batches and format each as it arrives, so a
+    # large source holds formatted strings but never the full row set.
+    # Optional lines (answer, warnings) collapse to "" when absent so each
+    # row is still a single f-string
+    rows = [
+        f"{idx}. [{card[_K_TYPE].upper()}] {card[_K_FRONT]}\n"
+        f"{f'   Answer: {_truncate(card[_K_BACK], 100)}\n' if card[_K_BACK] else ''}"
+        f"   Deck: {card[_K_DECK]} | Created: {card[_K_CREATED]}\n"
+        f"{f'   Warnings: {card[_K_WARN]}\n' if card[_K_WARN] else ''}"
+        "\n"
+        for idx, card in enumerate(db.iter_cards_by_source(source_path), 1)
+    ]
+
+    if not rows:
         return (
             f"No cards found from source: {source_path}\n\n"
             "This source may not exist or no cards have been generated from it yet."
         )
 
-    # Format output
-    output = f"Cards Generated from: {source_path}\n"
-    output += "=" * 80 + "\n"
-    output += f"Total cards: {len(cards)}\n\n"
-
-    for idx, card in enumerate(cards, 1):
-        card_type = card["card_type"].upper()
-        front_text = card["front_or_text"]
-        deck = card["deck"]
-        created = card["created_at"]
-
-        output += f"{idx}. [{card_type}] {front_text}\n"
-        if card["back"]:
-            output += (
-                f"   Answer: {card['back'][:100]}...\n"
-                if len(card["back"]) > 100
-                else f"   Answer: {card['back']}\n"
-            )
-        output += f"   Deck: {deck} | Created: {created}\n"
+    parts = [
+        f"Cards Generated from: {source_path}\n",
+        _SEP,
+        f"Total cards: {len(rows)}\n\n",
+        *rows,
+    ]
 
-        # Show validation warnings if any
-        if card["validation_warnings"]:
-            output += f"   Warnings: {card['validation_warnings']}\n"
-
-        output += "\n"
-
-    return output
+    return "".join(parts)
 
 
 @app.resource("card-history://stats")
@@ -103,39 +119,44 @@ async def validation_stats() -> str:
     Returns:
         Formatted validation statistics
     """
+    global _stats_cache
+    if _stats_cache is not None and time.monotonic() - _stats_cache[0] < _CACHE_TTL_SECONDS:
+        return _stats_cache[1]
+
     db = get_database()
     stats = db.get_validation_stats()
 
-    output = "Flashcard Quality Statistics\n"
-    output += "=" * 80 + "\n\n"
+    parts = ["Flashcard Quality Statistics\n", _SEP, "\n"]
 
     total = stats["total_cards"]
     with_warnings = stats["cards_with_warnings"]
     warning_rate = stats["warning_rate"]
 
-    output += f"Total cards created: {total}\n"
-    output += f"Cards with validation warnings: {with_warnings} ({warning_rate}%)\n"
-    output += f"Cards with no warnings: {total - with_warnings} ({100 - warning_rate:.2f}%)\n\n"
+    parts.append(f"Total cards created: {total}\n")
+    parts.append(f"Cards with validation warnings: {with_warnings} ({warning_rate}%)\n")
+    parts.append(f"Cards with no warnings: {total - with_warnings} ({100 - warning_rate:.2f}%)\n\n")
 
     if total > 0:
-        output += "Quality Score: "
+        parts.append("Quality Score: ")
         if warning_rate < 10:
-            output += "Excellent ✓\n"
+            parts.append("Excellent ✓\n")
         elif warning_rate < 25:
-            output += "Good\n"
+            parts.append("Good\n")
         elif warning_rate < 50:
-            output += "Fair - Consider reviewing card design\n"
+            parts.append("Fair - Consider reviewing card design\n")
         else:
-            output += "Needs Improvement - Many cards violate best practices\n"
+            parts.append("Needs Improvement - Many cards violate best practices\n")
 
-        output += "\nRecommendations:\n"
-        output += "- Review cards with warnings for quality improvements\n"
-        output += "- Follow minimum information principle (one concept per card)\n"
-        output += "- Keep answers concise (<50 words)\n"
-        output += "- Use cloze deletions for factual learning\n"
+        parts.append("\nRecommendations:\n")
+        parts.append("- Review cards with warnings for quality improvements\n")
+        parts.append("- Follow minimum information principle (one concept per card)\n")
+        parts.append("- Keep answers concise (<50 words)\n")
+        parts.append("- Use cloze deletions for factual learning\n")
     else:
-        output += "No cards created yet. Start creating flashcards to see statistics!\n"
+        parts.append("No cards created yet. Start creating flashcards to see statistics!\n")
 
+    output = "".join(parts)
+    _stats_cache = (time.monotonic(), output)
     return output
 
 
@@ -149,25 +170,26 @@ async def generation_history() -> str:
     Returns:
         Formatted generation history
     """
+    global _history_cache
+    if _history_cache is not None and time.monotonic() - _history_cache[0] < _CACHE_TTL_SECONDS:
+        return _history_cache[1]
+
     db = get_database()
     generations = db.get_generation_history(limit=100)
 
     if not generations:
         return "No generation sessions recorded yet."
 
-    output = "Card Generation History (100 most recent sessions)\n"
-    output += "=" * 80 + "\n\n"
-
-    for gen in generations:
-        gen_id = gen["id"]
-        source_type = gen["source_type"]
-        source_path = gen["source_path"] or "N/A"
-        card_count = gen["card_count"]
-        created = gen["generated_at"]
+    parts = ["Card Generation History (100 most recent sessions)\n", _SEP, "\n"]
 
-        output += f"Session #{gen_id} [{source_type.upper()}]\n"
-        output += f"  Source: {source_path}\n"
-        output += f"  Cards created: {card_count}\n"
-        output += f"  Date: {created}\n\n"
+    parts.extend(
+        f"Session #{gen['id']} [{gen['source_type'].upper()}]\n"
+        f"  Source: {gen['source_path'] or 'N/A'}\n"
+        f"  Cards created: {gen['card_count']}\n"
+        f"  Date: {gen['generated_at']}\n\n"
+        for gen in generations
+    )
 
+    output = "".join(parts)
+    _history_cache = (time.monotonic(), output)
     return output
@@ -1,17 +1,49 @@
 """FastMCP server instance and main entry point."""
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Flush shared resources when the server shuts down.
+
+    History writes are fire-and-forget while the server runs, so the
+    shutdown path drains the pending task set to keep the last queued rows
+    from being lost, then closes the client's pooled HTTP connection. The
+    imports are deferred for the same reason as in _register.
+    """
+    try:
+        yield
+    finally:
+        from .client import get_anki_client
+        from .tools.common import drain_bg_tasks
+
+        await drain_bg_tasks()
+        await get_anki_client().aclose()
+
+
 # Create FastMCP application instance
-app = FastMCP("anki-connect-mcp")
+app = FastMCP("anki-connect-mcp", lifespan=_lifespan)
+
+
+def _register() -> None:
+    """Register all tools and resources with the MCP server.
+
+    Deferred out of module import so that importing anki_connect_mcp (or
+    this module, which tool submodules do for the app instance) stays cheap;
+    only the actual server process pays for loading every tool module.
+    """
+    from . import resources, tools  # noqa: F401
 
-# Import tools and resources to register them with the MCP server
-# This must come after app creation
-from . import resources, tools  # noqa: E402, F401
+    tools.register_all()
 
 
 def main() -> None:
     """Main entry point for the MCP server."""
+    _register()
     app.run()
 
 
@@ -1,6 +1,36 @@
-"""MCP tools for Anki flashcard management."""
+"""MCP tools for Anki flashcard management.
 
-# Import tools to register them with the MCP server
-from . import analysis, cards, decks, memory, queries
+Submodules are imported lazily (PEP 562) so that importing this package does
+not pull in the HTTP client, database, and validator stacks until a tool
+module is actually needed. The server calls register_all() at startup, which
+imports every submodule for its @app.tool() registration side effects.
+"""
 
-__all__ = ["analysis", "cards", "decks", "memory", "queries"]
+import importlib
+import pkgutil
+
+# Discover tool submodules from the package directory instead of keeping a
+# hand-maintained list; a new tool module registers itself just by existing
+_SUBMODULES = tuple(
+    module.name for module in pkgutil.iter_modules(__path__) if not module.name.startswith("_")
+)
+
+__all__ = [*_SUBMODULES, "register_all"]
+
+
+def register_all() -> None:
+    """Import every tool submodule so its tools register with the server."""
+    for name in _SUBMODULES:
+        importlib.import_module(f".{name}", __package__)
+
+
+def __getattr__(name: str):
+    if name in _SUBMODULES:
+        module = importlib.import_module(f".{name}", __package__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(__all__)
@@ -7,18 +7,156 @@ based on the specific learning context and goals.
 Philosophy: Tools provide data, LLM provides wisdom.
 """
 
+import asyncio
 import re
+import time
+from array import array
+from bisect import bisect
 from collections import Counter
+from collections.abc import AsyncIterator
+from functools import lru_cache
+from heapq import heappush, heappushpop
+from random import sample
 
 from mcp.types import CallToolResult, TextContent
 
-from ..client import AnkiConnectionError, get_anki_client
-from ..db.database import get_database
-from ..formatting import strip_html
+from ..client import AnkiClient, get_anki_client
+from ..db.database import get_background_database
+from ..formatting import find_cloze_numbers, strip_html
 from ..server import app
+from .common import run_db_write_in_background, with_anki_error_handling
+
+# One alternation over the formatting tags we treat as "uses HTML", so each
+# field is scanned once instead of once per tag literal
+_HTML_TAG_RE = re.compile(r"<(?:b|i|u|br|sub|sup|ul|ol|div|span)>")
+
+# Whitespace-delimited token, for counting words without materializing the
+# token list that str.split() would allocate per field
+_WORD_RE = re.compile(r"\S+")
+
+# Ease buckets in ascending order with the edges that separate them; bisect
+# over the edges maps an ease value straight to its bucket label
+_EASE_BUCKET_LABELS = ("<1.5 (struggling)", "1.5-2.0", "2.0-2.5", ">2.5")
+_EASE_BUCKET_EDGES = (1.5, 2.0, 2.5)
+
+# Batch size for streamed notes_info fetches
+_NOTES_CHUNK_SIZE = 500
+
+# Observation rows produced by get_deck_recommendations' collection passes;
+# a module-level alias because type checkers reject local variables in
+# annotations
+type _Observations = list[dict[str, str | int | float | list[int]]]
+
+# Analysis output depends only on deck contents, and within one session those
+# change through this server's own card tools. A short TTL cache keyed on the
+# tool's arguments turns repeated analyses of the same deck (a common pattern
+# when an LLM cross-references quality and recommendations) into a dict
+# lookup; card tools invalidate it whenever they change deck contents.
+_REPORT_TTL_SECONDS = 60.0
+_report_cache: dict[tuple, tuple[float, CallToolResult]] = {}
+
+
+def invalidate_deck_reports() -> None:
+    """Drop all cached analysis reports after deck contents change."""
+    _report_cache.clear()
+
+
+def _cached_report(key: tuple) -> CallToolResult | None:
+    """Return a cached report for key if it is still fresh."""
+    entry = _report_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] < _REPORT_TTL_SECONDS:
+        return entry[1]
+    return None
+
+
+def _save_analysis_in_background(**kwargs) -> None:
+    """Persist a deck analysis via save_deck_analysis without blocking.
+
+    The write is fire-and-forget analysis history and goes through a
+    background Database so its transaction cannot collide with concurrent
+    writes.
+    """
+    run_db_write_in_background(get_background_database().save_deck_analysis, **kwargs)
+
+
+# Notes in a deck often repeat template boilerplate or identical fields, so
+# strip_html results are memoized per unique value during an analysis run;
+# the cache is cleared when the run finishes to keep memory bounded
+_strip_html_cached = lru_cache(maxsize=4096)(strip_html)
+
+
+async def _resolve_deck_and_cards(
+    client: AnkiClient, deck_name: str
+) -> tuple[list[int], CallToolResult | None]:
+    """Fetch a deck's card IDs, diagnosing a missing deck only on failure.
+
+    The optimistic path assumes the deck exists and issues just the
+    find_cards query - the overwhelmingly common case, since deck names
+    usually come from a prior list_decks call. Only when that returns no
+    cards (which is also what AnkiConnect reports for a nonexistent deck)
+    do we fetch the deck list to distinguish "empty deck" from "missing
+    deck" and compute near-miss suggestions.
+
+    Args:
+        client: AnkiConnect client
+        deck_name: Deck to resolve
+
+    Returns:
+        Tuple of (card_ids, error). error is a ready-to-return
+        CallToolResult when the deck is missing, in which case card_ids is
+        empty; otherwise error is None.
+    """
+    card_ids = await client.find_cards(f'deck:"{deck_name}"')
+    if card_ids:
+        return card_ids, None
+
+    existing_decks = await client.deck_names()
+    if deck_name not in existing_decks:
+        suggestions = await client.suggest_decks(deck_name)
+        error_msg = f"Deck '{deck_name}' not found."
+        if suggestions:
+            error_msg += "\n\nDid you mean one of these?"
+            error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions)
+        else:
+            error_msg += "\n\nUse list_decks to see all available decks."
+        return [], CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
+
+    return card_ids, None
+
+
+async def _iter_notes_info(client: AnkiClient, note_ids: list[int]) -> AsyncIterator[dict]:
+    """Stream notes_info in batches, prefetching one batch ahead.
+
+    A single notes_info call holds every note in memory and leaves the CPU
+    idle during the round trip. Fetching in chunks with the next request
+    already in flight overlaps AnkiConnect latency with analysis work and
+    caps resident notes at roughly two batches.
+
+    Args:
+        client: AnkiConnect client
+        note_ids: Note IDs to fetch
+
+    Yields:
+        Note info dicts in note_ids order
+    """
+    chunks = [
+        note_ids[start : start + _NOTES_CHUNK_SIZE]
+        for start in range(0, len(note_ids), _NOTES_CHUNK_SIZE)
+    ]
+    if not chunks:
+        return
+
+    next_task = asyncio.create_task(client.notes_info(chunks[0]))
+    for index in range(len(chunks)):
+        task = next_task
+        if index + 1 < len(chunks):
+            next_task = asyncio.create_task(client.notes_info(chunks[index + 1]))
+        for note in await task:
+            yield note
 
 
 @app.tool()
+@with_anki_error_handling
 async def analyze_deck_quality(
     deck_name: str,
     sample_size: int | None = None,
@@ -47,66 +185,46 @@ async def analyze_deck_quality(
         With problematic card details:
         >>> analyze_deck_quality("Math", include_card_details=True)
     """
+    cache_key = ("quality", deck_name, sample_size, include_card_details)
+    if (cached := _cached_report(cache_key)) is not None:
+        return cached
+
     try:
-        # Check if deck exists
         client = get_anki_client()
-        existing_decks = await client.deck_names()
-
-        if deck_name not in existing_decks:
-            suggestions = [d for d in existing_decks if deck_name.lower() in d.lower()]
-            error_msg = f"Deck '{deck_name}' not found."
-            if suggestions:
-                error_msg += "\n\nDid you mean one of these?"
-                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions[:5])
-            else:
-                error_msg += "\n\nUse list_decks to see all available decks."
-            return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
-
-        # Fetch all cards in deck
-        card_ids = await client.find_cards(f'deck:"{deck_name}"')
+        card_ids, error = await _resolve_deck_and_cards(client, deck_name)
+        if error:
+            return error
 
         if not card_ids:
             msg = f"Deck '{deck_name}' is empty (0 cards).\n\n"
             msg += "No structural data to analyze."
             return CallToolResult(content=[TextContent(type="text", text=msg)])
 
-        # Sample if requested
-        import random
-
-        original_count = len(card_ids)
-        if sample_size and sample_size < len(card_ids):
-            card_ids = random.sample(card_ids, sample_size)
-
-        # Get note details
-        cards_info = await client.cards_info(card_ids)
-        note_ids = list({card["note"] for card in cards_info})
-        notes_info = await client.notes_info(note_ids)
+        # Cards were only being fetched here to derive their note IDs, so
+        # query notes directly and skip the cards_info round trip entirely
+        note_ids = await client.find_notes(f'deck:"{deck_name}"')
 
-        # Analyze structural patterns
-        type_counter: Counter[str] = Counter()
+        # Sample if requested
+        original_count = len(note_ids)
+        if sample_size and sample_size < len(note_ids):
+            note_ids = sample(note_ids, sample_size)
+
+        # Analyze structural patterns; model names are collected during the
+        # streamed pass and tallied in one Counter() call afterwards, which
+        # counts in C instead of a dict get/set per note
+        model_names: list[str] = []
         tag_usage = 0
         html_usage = 0
-        field_lengths: list[int] = []
-        word_counts: list[int] = []
-        cloze_counts: list[int] = []
+        # Packed int32 accumulators - one field entry per note field, so
+        # these grow large on big decks and boxed ints would dominate
+        field_lengths = array("i")
+        word_counts = array("i")
+        cloze_counts = array("i")
         card_details: list[dict[str, str | int | list[str]]] = []
 
-        html_tags = [
-            "<b>",
-            "<i>",
-            "<u>",
-            "<br>",
-            "<sub>",
-            "<sup>",
-            "<ul>",
-            "<ol>",
-            "<div>",
-            "<span>",
-        ]
-
-        for note in notes_info:
+        async for note in _iter_notes_info(client, note_ids):
             model_name = note.get("modelName", "Unknown")
-            type_counter[model_name] += 1
+            model_names.append(model_name)
 
             tags = note.get("tags", [])
             if tags:
@@ -118,19 +236,20 @@ async def analyze_deck_quality(
             for field_data in fields.values():
                 field_value = field_data.get("value", "")
 
-                # Check for HTML
-                if any(tag in field_value for tag in html_tags):
+                # Check for HTML; one hit flags the note, so skip the scan
+                # on its remaining fields
+                if not note_has_html and _HTML_TAG_RE.search(field_value):
                     note_has_html = True
 
                 # Track field length
-                clean_text = strip_html(field_value)
+                clean_text = _strip_html_cached(field_value)
                 field_lengths.append(len(clean_text))
-                word_counts.append(len(clean_text.split()))
+                word_counts.append(sum(1 for _ in _WORD_RE.finditer(clean_text)))
 
                 # Count cloze deletions
-                cloze_matches = re.findall(r"\{\{c\d+::", field_value)
-                if cloze_matches:
-                    cloze_counts.append(len(cloze_matches))
+                cloze_count = len(find_cloze_numbers(field_value))
+                if cloze_count:
+                    cloze_counts.append(cloze_count)
 
             if note_has_html:
                 html_usage += 1
@@ -145,77 +264,82 @@ async def analyze_deck_quality(
                 # Add first field preview
                 first_field = list(fields.values())[0] if fields else {}
                 first_value = first_field.get("value", "")
-                preview = strip_html(first_value)[:100]
+                preview = _strip_html_cached(first_value)[:100]
                 if len(first_value) > 100:
                     preview += "..."
                 detail["preview"] = preview
                 card_details.append(detail)
 
-        # Build response
-        total_cards = len(notes_info)
-        msg = f"Deck Structure Analysis: '{deck_name}'\n"
+        # Build response as parts and join once - linear instead of quadratic
+        type_counter = Counter(model_names)
+        total_cards = len(note_ids)
+        pct_scale = 100.0 / total_cards  # constant divisor hoisted out of the row loops
+        parts = [f"Deck Structure Analysis: '{deck_name}'\n"]
         if sample_size and sample_size < original_count:
-            msg += f"(Sample of {total_cards} from {original_count} total cards)\n"
-        msg += "\n"
+            parts.append(f"(Sample of {total_cards} from {original_count} total cards)\n")
+        parts.append("\n")
 
         # Basic counts
-        msg += f"Total Cards: {total_cards}\n"
-        msg += f"Cards with Tags: {tag_usage} ({tag_usage / total_cards * 100:.0f}%)\n"
-        msg += f"Cards with HTML: {html_usage} ({html_usage / total_cards * 100:.0f}%)\n\n"
+        parts.append(f"Total Cards: {total_cards}\n")
+        parts.append(f"Cards with Tags: {tag_usage} ({tag_usage * pct_scale:.0f}%)\n")
+        parts.append(f"Cards with HTML: {html_usage} ({html_usage * pct_scale:.0f}%)\n\n")
 
         # Card type distribution
-        msg += "Card Type Distribution:\n"
-        for card_type, count in type_counter.most_common():
-            pct = count / total_cards * 100
-            msg += f"  {card_type}: {count} ({pct:.0f}%)\n"
-        msg += "\n"
+        parts.append("Card Type Distribution:\n")
+        parts.extend(
+            f"  {card_type}: {count} ({count * pct_scale:.0f}%)\n"
+            for card_type, count in type_counter.most_common()
+        )
+        parts.append("\n")
 
-        # Field statistics
+        # Field statistics; the average is also reused for the saved metadata
+        avg_field_len = sum(field_lengths) / len(field_lengths) if field_lengths else 0
         if field_lengths:
-            avg_field_len = sum(field_lengths) / len(field_lengths)
             max_field_len = max(field_lengths)
             min_field_len = min(field_lengths)
-            msg += "Field Length Stats (characters):\n"
-            msg += f"  Average: {avg_field_len:.0f}\n"
-            msg += f"  Min: {min_field_len}\n"
-            msg += f"  Max: {max_field_len}\n\n"
+            parts.append("Field Length Stats (characters):\n")
+            parts.append(f"  Average: {avg_field_len:.0f}\n")
+            parts.append(f"  Min: {min_field_len}\n")
+            parts.append(f"  Max: {max_field_len}\n\n")
 
         if word_counts:
             avg_words = sum(word_counts) / len(word_counts)
             max_words = max(word_counts)
-            msg += "Word Count Stats:\n"
-            msg += f"  Average: {avg_words:.1f}\n"
-            msg += f"  Max: {max_words}\n\n"
+            parts.append("Word Count Stats:\n")
+            parts.append(f"  Average: {avg_words:.1f}\n")
+            parts.append(f"  Max: {max_words}\n\n")
 
         # Cloze statistics if any
         if cloze_counts:
             avg_cloze = sum(cloze_counts) / len(cloze_counts)
             max_cloze = max(cloze_counts)
-            msg += f"Cloze Stats ({len(cloze_counts)} cloze cards):\n"
-            msg += f"  Average deletions per card: {avg_cloze:.1f}\n"
-            msg += f"  Max deletions in a card: {max_cloze}\n\n"
+            parts.append(f"Cloze Stats ({len(cloze_counts)} cloze cards):\n")
+            parts.append(f"  Average deletions per card: {avg_cloze:.1f}\n")
+            parts.append(f"  Max deletions in a card: {max_cloze}\n\n")
 
         # Card details if requested
         if include_card_details and card_details:
-            msg += f"\nCard Details (first {min(10, len(card_details))}):\n"
+            parts.append(f"\nCard Details (first {min(10, len(card_details))}):\n")
             for detail in card_details[:10]:
-                msg += f"  Note {detail['note_id']} [{detail['model']}]\n"
-                msg += f"    Preview: {detail['preview']}\n"
+                parts.append(f"  Note {detail['note_id']} [{detail['model']}]\n")
+                parts.append(f"    Preview: {detail['preview']}\n")
                 tags_str = ", ".join(detail["tags"]) if detail["tags"] else "(no tags)"  # type: ignore
-                msg += f"    Tags: {tags_str}\n"
+                parts.append(f"    Tags: {tags_str}\n")
 
-        msg += "\nThis is raw structural data. Use your judgment about quality "
-        msg += "based on the specific learning context and goals."
+        parts.append(
+            "\nThis is raw structural data. Use your judgment about quality "
+            "based on the specific learning context and goals."
+        )
+        msg = "".join(parts)
 
-        # Save raw data to database
-        db = get_database()
+        # Save raw data to database off the response path
         metadata = {
             "card_type_distribution": dict(type_counter),
-            "tag_usage_percent": tag_usage / total_cards * 100 if total_cards > 0 else 0,
-            "html_usage_percent": html_usage / total_cards * 100 if total_cards > 0 else 0,
-            "avg_field_length": sum(field_lengths) / len(field_lengths) if field_lengths else 0,
+            "tag_usage_percent": tag_usage * pct_scale,
+            "html_usage_percent": html_usage * pct_scale,
+            "avg_field_length": avg_field_len,
         }
-        db.save_deck_analysis(
+        _save_analysis_in_background(
             deck_name=deck_name,
             analysis_type="quality_raw",
             overall_score=None,
@@ -223,30 +347,18 @@ async def analyze_deck_quality(
             metadata=metadata,
         )
 
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
+        result = CallToolResult(content=[TextContent(type="text", text=msg)])
+        _report_cache[cache_key] = (time.monotonic(), result)
+        return result
 
-    except AnkiConnectionError as e:
-        return CallToolResult(
-            isError=True,
-            content=[
-                TextContent(
-                    type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
-                )
-            ],
-        )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+    finally:
+        # Duplicate fields only repeat within one deck; drop the memo so the
+        # cache doesn't pin field text between tool calls
+        _strip_html_cached.cache_clear()
 
 
 @app.tool()
+@with_anki_error_handling
 async def analyze_deck_performance(
     deck_name: str,
     min_reviews: int = 1,
@@ -272,191 +384,169 @@ async def analyze_deck_performance(
         Only analyze reviewed cards:
         >>> analyze_deck_performance("Math", min_reviews=3)
     """
-    try:
-        # Check if deck exists
-        client = get_anki_client()
-        existing_decks = await client.deck_names()
-
-        if deck_name not in existing_decks:
-            suggestions = [d for d in existing_decks if deck_name.lower() in d.lower()]
-            error_msg = f"Deck '{deck_name}' not found."
-            if suggestions:
-                error_msg += "\n\nDid you mean one of these?"
-                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions[:5])
-            else:
-                error_msg += "\n\nUse list_decks to see all available decks."
-            return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
-
-        # Fetch all cards in deck
-        card_ids = await client.find_cards(f'deck:"{deck_name}"')
-
-        if not card_ids:
-            msg = f"Deck '{deck_name}' is empty (0 cards).\n\n"
-            msg += "No performance data to analyze."
-            return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-        # Get card details
-        cards_info = await client.cards_info(card_ids)
-
-        # Calculate metrics
-        ease_values: list[float] = []
-        lapses: list[int] = []
-        intervals: list[int] = []
-        new_count = 0
-        learning_count = 0
-        review_count = 0
-        struggling_cards: list[dict[str, int | float]] = []
+    cache_key = ("performance", deck_name, min_reviews, lookback_days)
+    if (cached := _cached_report(cache_key)) is not None:
+        return cached
+
+    client = get_anki_client()
+    card_ids, error = await _resolve_deck_and_cards(client, deck_name)
+    if error:
+        return error
+
+    if not card_ids:
+        msg = f"Deck '{deck_name}' is empty (0 cards).\n\n"
+        msg += "No performance data to analyze."
+        return CallToolResult(content=[TextContent(type="text", text=msg)])
 
-        for card in cards_info:
-            # Card type: 0=new, 1=learning, 2=review, 3=relearning
-            card_type = card.get("type", 0)
-            if card_type == 0:
-                new_count += 1
-            elif card_type == 1:
-                learning_count += 1
+    # Get card details
+    cards_info = await client.cards_info(card_ids)
+
+    # Calculate metrics; numeric accumulators are packed arrays, one
+    # entry per card, same append/sum/min/max interface as lists
+    ease_values = array("d")
+    lapses = array("i")
+    intervals = array("i")
+    new_count = 0
+    learning_count = 0
+    review_count = 0
+    # Only the 10 lowest-ease struggling cards are ever rendered, so keep
+    # a bounded max-heap (keyed on -ease) plus a running total instead of
+    # a dict per struggling card
+    struggling_heap: list[tuple[float, int, int, int]] = []
+    struggling_total = 0
+
+    for card in cards_info:
+        # Card type: 0=new, 1=learning, 2=review, 3=relearning
+        card_type = card.get("type", 0)
+        if card_type == 0:
+            new_count += 1
+        elif card_type == 1:
+            learning_count += 1
+        else:
+            review_count += 1
+
+        # Get ease factor (Anki stores as integer, e.g., 2500 = 250%)
+        ease = card.get("factor", 0) / 1000.0
+        if ease > 0:
+            ease_values.append(ease)
+
+        # Get lapses and interval
+        lapse_count = card.get("lapses", 0)
+        lapses.append(lapse_count)
+
+        interval_days = card.get("interval", 0)
+        if interval_days > 0:
+            intervals.append(interval_days)
+
+        # Track struggling cards (low ease or high lapses)
+        if ease > 0 and (ease < 1.5 or lapse_count > 2):
+            struggling_total += 1
+            entry = (-ease, lapse_count, interval_days, card.get("note", 0))
+            if struggling_total <= 10:
+                heappush(struggling_heap, entry)
             else:
-                review_count += 1
-
-            # Get ease factor (Anki stores as integer, e.g., 2500 = 250%)
-            ease = card.get("factor", 0) / 1000.0
-            if ease > 0:
-                ease_values.append(ease)
-
-            # Get lapses and interval
-            lapse_count = card.get("lapses", 0)
-            lapses.append(lapse_count)
-
-            interval_days = card.get("interval", 0)
-            if interval_days > 0:
-                intervals.append(interval_days)
-
-            # Track struggling cards (low ease or high lapses)
-            if ease > 0 and (ease < 1.5 or lapse_count > 2):
-                struggling_cards.append(
-                    {
-                        "note_id": card.get("note", 0),
-                        "ease": ease,
-                        "lapses": lapse_count,
-                        "interval": interval_days,
-                    }
-                )
-
-        # Build response
-        total_cards = len(cards_info)
-        msg = f"Deck Performance Data: '{deck_name}'\n\n"
-
-        # Card state distribution
-        msg += "Card State Distribution:\n"
-        msg += f"  New: {new_count} ({new_count / total_cards * 100:.0f}%)\n"
-        msg += f"  Learning: {learning_count} ({learning_count / total_cards * 100:.0f}%)\n"
-        msg += f"  Review: {review_count} ({review_count / total_cards * 100:.0f}%)\n\n"
-
-        # Ease distribution
-        if ease_values:
-            avg_ease = sum(ease_values) / len(ease_values)
-            min_ease = min(ease_values)
-            max_ease = max(ease_values)
-
-            # Bucket ease values
-            ease_buckets = {"<1.5 (struggling)": 0, "1.5-2.0": 0, "2.0-2.5": 0, ">2.5": 0}
-            for e in ease_values:
-                if e < 1.5:
-                    ease_buckets["<1.5 (struggling)"] += 1
-                elif e < 2.0:
-                    ease_buckets["1.5-2.0"] += 1
-                elif e < 2.5:
-                    ease_buckets["2.0-2.5"] += 1
-                else:
-                    ease_buckets[">2.5"] += 1
-
-            msg += f"Ease Factor Stats ({len(ease_values)} cards with reviews):\n"
-            msg += f"  Average: {avg_ease:.2f}\n"
-            msg += f"  Min: {min_ease:.2f}\n"
-            msg += f"  Max: {max_ease:.2f}\n"
-            msg += "  Distribution:\n"
-            for bucket, count in ease_buckets.items():
-                pct = count / len(ease_values) * 100 if ease_values else 0
-                msg += f"    {bucket}: {count} ({pct:.0f}%)\n"
-            msg += "\n"
-
-        # Lapse statistics
-        if lapses:
-            total_lapses = sum(lapses)
-            cards_with_lapses = sum(1 for lapse in lapses if lapse > 0)
-            max_lapses = max(lapses)
-            msg += "Lapse Statistics:\n"
-            msg += f"  Total lapses: {total_lapses}\n"
-            msg += f"  Cards with lapses: {cards_with_lapses} "
-            msg += f"({cards_with_lapses / total_cards * 100:.0f}%)\n"
-            msg += f"  Max lapses on single card: {max_lapses}\n\n"
-
-        # Interval statistics
-        if intervals:
-            avg_interval = sum(intervals) / len(intervals)
-            max_interval = max(intervals)
-            msg += "Interval Statistics (days):\n"
-            msg += f"  Average: {avg_interval:.1f}\n"
-            msg += f"  Max: {max_interval}\n\n"
-
-        # Struggling cards
-        if struggling_cards:
-            msg += f"Potentially Struggling Cards ({len(struggling_cards)}):\n"
-            # Sort by ease (lowest first)
-            struggling_cards.sort(key=lambda x: x["ease"])
-            for card in struggling_cards[:10]:
-                msg += f"  Note {card['note_id']}: "
-                msg += f"ease={card['ease']:.2f}, "
-                msg += f"lapses={card['lapses']}, "
-                msg += f"interval={card['interval']}d\n"
-            if len(struggling_cards) > 10:
-                msg += f"  ...and {len(struggling_cards) - 10} more\n"
-            msg += "\n"
-
-        msg += "This is raw performance data. Use your judgment about what needs "
-        msg += "attention based on the specific learning context."
-
-        # Save raw data to database
-        db = get_database()
-        metadata = {
-            "new_count": new_count,
-            "learning_count": learning_count,
-            "review_count": review_count,
-            "avg_ease": sum(ease_values) / len(ease_values) if ease_values else 0,
-            "total_lapses": sum(lapses),
-            "struggling_count": len(struggling_cards),
-        }
-        db.save_deck_analysis(
-            deck_name=deck_name,
-            analysis_type="performance_raw",
-            overall_score=None,
-            total_cards=total_cards,
-            metadata=metadata,
+                heappushpop(struggling_heap, entry)
+
+    # Build response as parts and join once - linear instead of quadratic
+    total_cards = len(cards_info)
+    pct_scale = 100.0 / total_cards  # constant divisor hoisted out of the row loops
+    parts = [f"Deck Performance Data: '{deck_name}'\n\n"]
+
+    # Card state distribution
+    parts.append("Card State Distribution:\n")
+    parts.append(f"  New: {new_count} ({new_count * pct_scale:.0f}%)\n")
+    parts.append(f"  Learning: {learning_count} ({learning_count * pct_scale:.0f}%)\n")
+    parts.append(f"  Review: {review_count} ({review_count * pct_scale:.0f}%)\n\n")
+
+    # Ease distribution; the average and lapse total are also reused for
+    # the saved metadata
+    avg_ease = sum(ease_values) / len(ease_values) if ease_values else 0
+    total_lapses = sum(lapses)
+    if ease_values:
+        min_ease = min(ease_values)
+        max_ease = max(ease_values)
+
+        # Bucket ease values via bisect instead of a branch chain per card
+        bucket_counts = Counter(
+            _EASE_BUCKET_LABELS[bisect(_EASE_BUCKET_EDGES, e)] for e in ease_values
         )
-
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-    except AnkiConnectionError as e:
-        return CallToolResult(
-            isError=True,
-            content=[
-                TextContent(
-                    type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
-                )
-            ],
+        ease_buckets = {label: bucket_counts[label] for label in _EASE_BUCKET_LABELS}
+
+        parts.append(f"Ease Factor Stats ({len(ease_values)} cards with reviews):\n")
+        parts.append(f"  Average: {avg_ease:.2f}\n")
+        parts.append(f"  Min: {min_ease:.2f}\n")
+        parts.append(f"  Max: {max_ease:.2f}\n")
+        parts.append("  Distribution:\n")
+        ease_pct_scale = 100.0 / len(ease_values)
+        parts.extend(
+            f"    {bucket}: {count} ({count * ease_pct_scale:.0f}%)\n"
+            for bucket, count in ease_buckets.items()
         )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
+        parts.append("\n")
+
+    # Lapse statistics
+    if lapses:
+        cards_with_lapses = sum(1 for lapse in lapses if lapse > 0)
+        max_lapses = max(lapses)
+        parts.append("Lapse Statistics:\n")
+        parts.append(f"  Total lapses: {total_lapses}\n")
+        parts.append(f"  Cards with lapses: {cards_with_lapses} ")
+        parts.append(f"({cards_with_lapses * pct_scale:.0f}%)\n")
+        parts.append(f"  Max lapses on single card: {max_lapses}\n\n")
+
+    # Interval statistics
+    if intervals:
+        avg_interval = sum(intervals) / len(intervals)
+        max_interval = max(intervals)
+        parts.append("Interval Statistics (days):\n")
+        parts.append(f"  Average: {avg_interval:.1f}\n")
+        parts.append(f"  Max: {max_interval}\n\n")
+
+    # Struggling cards; sorting the negated keys descending yields
+    # lowest ease first
+    if struggling_total:
+        parts.append(f"Potentially Struggling Cards ({struggling_total}):\n")
+        parts.extend(
+            f"  Note {note_id}: ease={-neg_ease:.2f}, "
+            f"lapses={lapse_count}, interval={interval_days}d\n"
+            for neg_ease, lapse_count, interval_days, note_id in sorted(
+                struggling_heap, reverse=True
+            )
         )
+        if struggling_total > 10:
+            parts.append(f"  ...and {struggling_total - 10} more\n")
+        parts.append("\n")
+
+    parts.append(
+        "This is raw performance data. Use your judgment about what needs "
+        "attention based on the specific learning context."
+    )
+    msg = "".join(parts)
+
+    # Save raw data to database off the response path
+    metadata = {
+        "new_count": new_count,
+        "learning_count": learning_count,
+        "review_count": review_count,
+        "avg_ease": avg_ease,
+        "total_lapses": total_lapses,
+        "struggling_count": struggling_total,
+    }
+    _save_analysis_in_background(
+        deck_name=deck_name,
+        analysis_type="performance_raw",
+        overall_score=None,
+        total_cards=total_cards,
+        metadata=metadata,
+    )
+
+    result = CallToolResult(content=[TextContent(type="text", text=msg)])
+    _report_cache[cache_key] = (time.monotonic(), result)
+    return result
 
 
 @app.tool()
+@with_anki_error_handling
 async def get_deck_recommendations(
     deck_name: str,
     max_recommendations: int = 10,
@@ -490,152 +580,147 @@ async def get_deck_recommendations(
     """
     # Note: This function is kept for backward compatibility but now returns
     # raw data that the LLM can interpret rather than prescriptive recommendations.
-    try:
-        # Check if deck exists
-        client = get_anki_client()
-        existing_decks = await client.deck_names()
-
-        if deck_name not in existing_decks:
-            suggestions = [d for d in existing_decks if deck_name.lower() in d.lower()]
-            error_msg = f"Deck '{deck_name}' not found."
-            if suggestions:
-                error_msg += "\n\nDid you mean one of these?"
-                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions[:5])
-            else:
-                error_msg += "\n\nUse list_decks to see all available decks."
-            return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
-
-        # Validate focus_area
-        if focus_area not in ["quality", "performance", "both"]:
-            return CallToolResult(
-                isError=True,
-                content=[
-                    TextContent(
-                        type="text",
-                        text=(
-                            f"Invalid focus_area: '{focus_area}'. "
-                            "Must be 'quality', 'performance', or 'both'."
-                        ),
-                    )
-                ],
-            )
-
-        # Fetch card data
-        card_ids = await client.find_cards(f'deck:"{deck_name}"')
-        if not card_ids:
-            msg = f"Deck '{deck_name}' is empty. No data to analyze for recommendations."
-            return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-        cards_info = await client.cards_info(card_ids)
-        note_ids = list({card["note"] for card in cards_info})
-        notes_info = await client.notes_info(note_ids)
-
-        # Collect observations (raw data, not judgments)
-        observations: list[dict[str, str | int | float | list[int]]] = []
-
-        # Quality observations
-        if focus_area in ["quality", "both"]:
-            # Tag usage
-            tagged_count = sum(1 for n in notes_info if n.get("tags"))
-            tag_pct = tagged_count / len(notes_info) * 100 if notes_info else 0
-            tag_desc = f"{tagged_count} of {len(notes_info)} cards have tags ({tag_pct:.0f}%)"
-            observations.append(
-                {
-                    "area": "quality",
-                    "metric": "tag_usage",
-                    "value": tag_pct,
-                    "description": tag_desc,
-                }
-            )
-
-            # Card type diversity
-            type_counter: Counter[str] = Counter(n.get("modelName", "Unknown") for n in notes_info)
-            if type_counter:
-                dominant_type, dominant_count = type_counter.most_common(1)[0]
-                dominant_pct = dominant_count / len(notes_info) * 100
-                observations.append(
-                    {
-                        "area": "quality",
-                        "metric": "type_diversity",
-                        "value": dominant_pct,
-                        "description": f"Most common type: {dominant_type} ({dominant_pct:.0f}%)",
-                    }
-                )
-
-        # Performance observations
-        if focus_area in ["performance", "both"]:
-            # Struggling cards
-            struggling: list[int] = []
-            for card in cards_info:
-                ease = card.get("factor", 0) / 1000.0
-                lapse_count = card.get("lapses", 0)
-                if ease > 0 and (ease < 1.5 or lapse_count > 2):
-                    struggling.append(card.get("note", 0))
-
-            observations.append(
-                {
-                    "area": "performance",
-                    "metric": "struggling_cards",
-                    "value": len(struggling),
-                    "description": f"{len(struggling)} cards with ease <1.5 or lapses >2",
-                    "note_ids": struggling[:20],
-                }
-            )
-
-            # Average ease
-            ease_values = [
-                c.get("factor", 0) / 1000.0 for c in cards_info if c.get("factor", 0) > 0
-            ]
-            if ease_values:
-                avg_ease = sum(ease_values) / len(ease_values)
-                observations.append(
-                    {
-                        "area": "performance",
-                        "metric": "avg_ease",
-                        "value": avg_ease,
-                        "description": f"Average ease factor: {avg_ease:.2f}",
-                    }
-                )
-
-        # Format response
-        msg = f"Deck Analysis Summary: '{deck_name}'\n"
-        msg += f"Focus: {focus_area}\n\n"
+    cache_key = ("recommendations", deck_name, max_recommendations, focus_area)
+    if (cached := _cached_report(cache_key)) is not None:
+        return cached
 
-        msg += "Observations (raw data for your interpretation):\n\n"
+    client = get_anki_client()
+    card_ids, error = await _resolve_deck_and_cards(client, deck_name)
+    if error:
+        return error
 
-        for obs in observations:
-            area = str(obs["area"]).upper()
-            metric = obs["metric"]
-            description = obs["description"]
-            msg += f"  [{area}] {metric}\n"
-            msg += f"    {description}\n"
-            if "note_ids" in obs and obs["note_ids"]:
-                note_ids_list = obs["note_ids"]
-                if isinstance(note_ids_list, list):
-                    msg += f"    Sample note IDs: {note_ids_list[:5]}\n"
-            msg += "\n"
-
-        msg += "Use your judgment to prioritize based on the user's learning goals. "
-        msg += "Consider using inspect_card() to examine specific cards."
-
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-    except AnkiConnectionError as e:
+    # Validate focus_area
+    if focus_area not in ["quality", "performance", "both"]:
         return CallToolResult(
             isError=True,
             content=[
                 TextContent(
                     type="text",
                     text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
+                        f"Invalid focus_area: '{focus_area}'. "
+                        "Must be 'quality', 'performance', or 'both'."
                     ),
                 )
             ],
         )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
+
+    if not card_ids:
+        msg = f"Deck '{deck_name}' is empty. No data to analyze for recommendations."
+        return CallToolResult(content=[TextContent(type="text", text=msg)])
+
+    async def collect_quality() -> _Observations:
+        """Quality pass: tag usage and type distribution over the notes.
+
+        Resolves note IDs via find_notes rather than through cards_info,
+        so this pass shares no RPC with the performance pass and the two
+        can run concurrently.
+        """
+        quality_obs: _Observations = []
+        note_ids = await client.find_notes(f'deck:"{deck_name}"')
+        total_notes = len(note_ids)
+
+        # Tag usage and card type distribution in one streamed pass
+        tagged_count = 0
+        type_counter: Counter[str] = Counter()
+        async for note in _iter_notes_info(client, note_ids):
+            if note.get("tags"):
+                tagged_count += 1
+            type_counter[note.get("modelName", "Unknown")] += 1
+
+        tag_pct = tagged_count / total_notes * 100 if total_notes else 0
+        tag_desc = f"{tagged_count} of {total_notes} cards have tags ({tag_pct:.0f}%)"
+        quality_obs.append(
+            {
+                "area": "quality",
+                "metric": "tag_usage",
+                "value": tag_pct,
+                "description": tag_desc,
+            }
         )
+
+        # Card type diversity
+        if type_counter:
+            dominant_type, dominant_count = type_counter.most_common(1)[0]
+            dominant_pct = dominant_count / total_notes * 100
+            quality_obs.append(
+                {
+                    "area": "quality",
+                    "metric": "type_diversity",
+                    "value": dominant_pct,
+                    "description": f"Most common type: {dominant_type} ({dominant_pct:.0f}%)",
+                }
+            )
+
+        return quality_obs
+
+    async def collect_performance() -> _Observations:
+        """Performance pass: struggling cards and average ease."""
+        perf_obs: _Observations = []
+        cards_info = await client.cards_info(card_ids)
+
+        # Struggling cards
+        struggling: list[int] = []
+        for card in cards_info:
+            ease = card.get("factor", 0) / 1000.0
+            lapse_count = card.get("lapses", 0)
+            if ease > 0 and (ease < 1.5 or lapse_count > 2):
+                struggling.append(card.get("note", 0))
+
+        perf_obs.append(
+            {
+                "area": "performance",
+                "metric": "struggling_cards",
+                "value": len(struggling),
+                "description": f"{len(struggling)} cards with ease <1.5 or lapses >2",
+                "note_ids": struggling[:20],
+            }
+        )
+
+        # Average ease
+        ease_values = [c.get("factor", 0) / 1000.0 for c in cards_info if c.get("factor", 0) > 0]
+        if ease_values:
+            avg_ease = sum(ease_values) / len(ease_values)
+            perf_obs.append(
+                {
+                    "area": "performance",
+                    "metric": "avg_ease",
+                    "value": avg_ease,
+                    "description": f"Average ease factor: {avg_ease:.2f}",
+                }
+            )
+
+        return perf_obs
+
+    # The two passes hit disjoint AnkiConnect endpoints, so "both" runs
+    # them concurrently; gather preserves order (quality first)
+    if focus_area == "both":
+        quality_obs, perf_obs = await asyncio.gather(collect_quality(), collect_performance())
+        observations = quality_obs + perf_obs
+    elif focus_area == "quality":
+        observations = await collect_quality()
+    else:
+        observations = await collect_performance()
+
+    # Build response as parts and join once - linear instead of quadratic
+    parts = [
+        f"Deck Analysis Summary: '{deck_name}'\n",
+        f"Focus: {focus_area}\n\n",
+        "Observations (raw data for your interpretation):\n\n",
+    ]
+
+    for obs in observations:
+        parts.append(f"  [{str(obs['area']).upper()}] {obs['metric']}\n")
+        parts.append(f"    {obs['description']}\n")
+        if "note_ids" in obs and obs["note_ids"]:
+            note_ids_list = obs["note_ids"]
+            if isinstance(note_ids_list, list):
+                parts.append(f"    Sample note IDs: {note_ids_list[:5]}\n")
+        parts.append("\n")
+
+    parts.append("Use your judgment to prioritize based on the user's learning goals. ")
+    parts.append("Consider using inspect_card() to examine specific cards.")
+    msg = "".join(parts)
+
+    result = CallToolResult(content=[TextContent(type="text", text=msg)])
+    _report_cache[cache_key] = (time.monotonic(), result)
+    return result
@@ -1,18 +1,79 @@
 """MCP tools for creating and managing Anki flashcards."""
 
-import re
-
 from mcp.types import CallToolResult, TextContent
 
-from ..client import AnkiConnectionError, get_anki_client
+from ..client import AnkiAPIError, get_anki_client
 from ..config import settings
-from ..db import get_database
-from ..formatting import get_text_length, highlight_code_blocks, strip_html
-from ..models import BasicCard, ClozeCard, TypeInCard
+from ..db import get_background_database, get_database
+from ..formatting import count_words, find_cloze_numbers, highlight_code_blocks, strip_html
+from ..models import BasicCard, CardBatch, ClozeCard, TypeInCard, validate_card_batch
 from ..server import app
+from .analysis import invalidate_deck_reports
+from .common import run_db_write_in_background, with_anki_error_handling
+
+# Anki model names and history card_type labels per card class - one place
+# keeps the create tools, the batch payload builder, and DB logging in sync
+_MODEL_NAMES = {
+    BasicCard: "Basic",
+    ClozeCard: "Cloze",
+    TypeInCard: "Basic (type in the answer)",
+}
+_CARD_TYPES = {BasicCard: "basic", ClozeCard: "cloze", TypeInCard: "type_in"}
+_VALID_CARD_TYPES = frozenset(_CARD_TYPES.values())
+_VALID_CARD_TYPES_TEXT = ", ".join(_CARD_TYPES.values())
+
+# Deletes cloze braces in one C-level pass instead of two chained replaces
+_BRACE_TRANS = str.maketrans("", "", "{}")
+
+# Human-readable labels for inspect_card_structure's fixed key vocabulary,
+# titled once at import instead of per response line
+_READABLE_KEYS = {
+    key: key.replace("_", " ").title()
+    for key in (
+        "card_type",
+        "front_word_count",
+        "front_char_count",
+        "front_has_html",
+        "front_has_question_mark",
+        "back_word_count",
+        "back_char_count",
+        "back_has_html",
+        "cloze_count",
+        "unique_cloze_numbers",
+        "has_valid_cloze_format",
+        "text_word_count",
+        "text_char_count",
+        "text_has_html",
+        "extra_word_count",
+        "extra_has_html",
+    )
+}
+
+# Fixed error messages, built once at import so the failure paths skip
+# re-validating the same TextContent payload on every call
+_ERR_NO_CLOZE = TextContent(
+    type="text",
+    text="Cloze card must contain at least one cloze deletion in {{c1::text}} format.",
+)
+_ERR_NO_CARDS = TextContent(type="text", text="No cards provided.")
+_ERR_NEED_TAG_OP = TextContent(
+    type="text",
+    text="At least one of tags_to_add or tags_to_remove must be provided.",
+)
+
+
+def _log_card_in_background(**kwargs) -> None:
+    """Persist a card via create_generation_with_card without blocking.
+
+    The write is fire-and-forget - the note ID is known as soon as
+    AnkiConnect responds - and goes through a background Database so its
+    transaction cannot collide with concurrent writes.
+    """
+    run_db_write_in_background(get_background_database().create_generation_with_card, **kwargs)
 
 
 @app.tool()
+@with_anki_error_handling
 async def create_basic_card(
     front: str,
     back: str,
@@ -71,67 +132,48 @@ async def create_basic_card(
         ...     deck="Physics::Fundamentals"
         ... )
     """
-    try:
-        # Create card model (validates basic constraints like min/max length)
-        card = BasicCard(
-            front=front, back=back, deck=deck or settings.default_deck, tags=tags or []
-        )
-
-        # Create note in Anki
-        client = get_anki_client()
-        note = {
-            "deckName": card.deck,
-            "modelName": "Basic",
-            "fields": {"Front": card.front, "Back": card.back},
-            "tags": card.tags,
-        }
-
-        # Auto-highlight code blocks in all fields
-        for field_name in note["fields"]:
-            note["fields"][field_name] = highlight_code_blocks(note["fields"][field_name])
-
-        note_id = await client.add_note(note)
-
-        # Log to database
-        db = get_database()
-        generation_id = db.create_generation(source_type="manual")
-        db.add_generated_card(
-            generation_id=generation_id,
-            anki_note_id=note_id,
-            card_type="basic",
-            front_or_text=card.front,
-            back=card.back,
-            deck=deck or settings.default_deck,
-            tags=card.tags,
-        )
-
-        # Build response message
-        msg = f"Card created successfully (Anki note ID: {note_id})\n\nDeck: {card.deck}"
-
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-    except AnkiConnectionError as e:
-        return CallToolResult(
-            isError=True,
-            content=[
-                TextContent(
-                    type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
-                )
-            ],
-        )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+    # Resolve the target deck once; settings is read a single time and
+    # the same value reaches both the card model and the history row
+    resolved_deck = deck or settings.default_deck
+
+    # Create card model (validates basic constraints like min/max length)
+    card = BasicCard(front=front, back=back, deck=resolved_deck, tags=tags or [])
+
+    # Create note in Anki
+    client = get_anki_client()
+    note = {
+        "deckName": card.deck,
+        "modelName": _MODEL_NAMES[BasicCard],
+        "fields": {"Front": card.front, "Back": card.back},
+        "tags": card.tags,
+    }
+
+    # Auto-highlight code blocks in all fields
+    for field_name in note["fields"]:
+        note["fields"][field_name] = highlight_code_blocks(note["fields"][field_name])
+
+    note_id = await client.add_note(note)
+    invalidate_deck_reports()
+
+    # Log to database off the response path
+    _log_card_in_background(
+        source_type="manual",
+        anki_note_id=note_id,
+        card_type=_CARD_TYPES[BasicCard],
+        front_or_text=card.front,
+        back=card.back,
+        deck=resolved_deck,
+        tags=card.tags,
+    )
+
+    # Build response message
+    msg = f"Card created successfully (Anki note ID: {note_id})\n\nDeck: {card.deck}"
+
+    return CallToolResult(content=[TextContent(type="text", text=msg)])
 
 
 @app.tool()
+@with_anki_error_handling
 async def create_cloze_card(
     text: str,
     deck: str | None = None,
@@ -186,87 +228,56 @@ async def create_cloze_card(
         ...     deck="Math::Geometry"
         ... )
     """
-    try:
-        # Create card model
-        card = ClozeCard(
-            text=text,
-            deck=deck or settings.default_deck,
-            tags=tags or [],
-            extra=extra,
-        )
-
-        # Validate cloze format (this is structural, not quality judgment)
-        if not re.search(r"\{\{c\d+::", card.text):
-            return CallToolResult(
-                isError=True,
-                content=[
-                    TextContent(
-                        type="text",
-                        text="Cloze card must contain at least one cloze deletion "
-                        "in {{c1::text}} format.",
-                    )
-                ],
-            )
-
-        # Create note in Anki
-        client = get_anki_client()
-        fields = {"Text": card.text}
-        if card.extra:
-            fields["Extra"] = card.extra
-
-        note = {
-            "deckName": card.deck,
-            "modelName": "Cloze",
-            "fields": fields,
-            "tags": card.tags,
-        }
-
-        # Auto-highlight code blocks in all fields
-        for field_name in note["fields"]:
-            note["fields"][field_name] = highlight_code_blocks(note["fields"][field_name])
-
-        note_id = await client.add_note(note)
-
-        # Log to database
-        db = get_database()
-        generation_id = db.create_generation(source_type="manual")
-        db.add_generated_card(
-            generation_id=generation_id,
-            anki_note_id=note_id,
-            card_type="cloze",
-            front_or_text=card.text,
-            back=None,
-            deck=deck or settings.default_deck,
-            tags=card.tags,
-        )
-
-        # Build response message
-        msg = f"Cloze card created successfully (Anki note ID: {note_id})\n\nDeck: {card.deck}"
-
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-    except AnkiConnectionError as e:
-        return CallToolResult(
-            isError=True,
-            content=[
-                TextContent(
-                    type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
-                )
-            ],
-        )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+    # Resolve the target deck once; settings is read a single time and
+    # the same value reaches both the card model and the history row
+    resolved_deck = deck or settings.default_deck
+
+    # Create card model
+    card = ClozeCard(text=text, deck=resolved_deck, tags=tags or [], extra=extra)
+
+    # Validate cloze format (this is structural, not quality judgment)
+    if not find_cloze_numbers(card.text):
+        return CallToolResult(isError=True, content=[_ERR_NO_CLOZE])
+
+    # Create note in Anki
+    client = get_anki_client()
+    fields = {"Text": card.text}
+    if card.extra:
+        fields["Extra"] = card.extra
+
+    note = {
+        "deckName": card.deck,
+        "modelName": _MODEL_NAMES[ClozeCard],
+        "fields": fields,
+        "tags": card.tags,
+    }
+
+    # Auto-highlight code blocks in all fields
+    for field_name in note["fields"]:
+        note["fields"][field_name] = highlight_code_blocks(note["fields"][field_name])
+
+    note_id = await client.add_note(note)
+    invalidate_deck_reports()
+
+    # Log to database off the response path
+    _log_card_in_background(
+        source_type="manual",
+        anki_note_id=note_id,
+        card_type=_CARD_TYPES[ClozeCard],
+        front_or_text=card.text,
+        back=None,
+        deck=resolved_deck,
+        tags=card.tags,
+    )
+
+    # Build response message
+    msg = f"Cloze card created successfully (Anki note ID: {note_id})\n\nDeck: {card.deck}"
+
+    return CallToolResult(content=[TextContent(type="text", text=msg)])
 
 
 @app.tool()
+@with_anki_error_handling
 async def create_type_in_card(
     front: str,
     back: str,
@@ -312,67 +323,172 @@ async def create_type_in_card(
         ...     deck="Chemistry::Nomenclature"
         ... )
     """
-    try:
-        # Create card model
-        card = TypeInCard(
-            front=front, back=back, deck=deck or settings.default_deck, tags=tags or []
-        )
+    # Resolve the target deck once; settings is read a single time and
+    # the same value reaches both the card model and the history row
+    resolved_deck = deck or settings.default_deck
+
+    # Create card model
+    card = TypeInCard(front=front, back=back, deck=resolved_deck, tags=tags or [])
+
+    # Create note in Anki
+    client = get_anki_client()
+    note = {
+        "deckName": card.deck,
+        "modelName": _MODEL_NAMES[TypeInCard],
+        "fields": {"Front": card.front, "Back": card.back},
+        "tags": card.tags,
+    }
+
+    # Auto-highlight code blocks in all fields
+    for field_name in note["fields"]:
+        note["fields"][field_name] = highlight_code_blocks(note["fields"][field_name])
+
+    note_id = await client.add_note(note)
+    invalidate_deck_reports()
+
+    # Log to database off the response path
+    _log_card_in_background(
+        source_type="manual",
+        anki_note_id=note_id,
+        card_type=_CARD_TYPES[TypeInCard],
+        front_or_text=card.front,
+        back=card.back,
+        deck=resolved_deck,
+        tags=card.tags,
+    )
+
+    # Build response message
+    msg = f"Type-in card created successfully (Anki note ID: {note_id})\n\nDeck: {card.deck}"
+
+    return CallToolResult(content=[TextContent(type="text", text=msg)])
+
+
+def _note_payload(card: BasicCard | ClozeCard | TypeInCard, default_deck: str) -> dict:
+    """Build the AnkiConnect note dict for a validated card model."""
+    if isinstance(card, ClozeCard):
+        fields = {"Text": card.text}
+        if card.extra:
+            fields["Extra"] = card.extra
+    else:
+        fields = {"Front": card.front, "Back": card.back}
 
-        # Create note in Anki
-        client = get_anki_client()
-        note = {
-            "deckName": card.deck,
-            "modelName": "Basic (type in the answer)",
-            "fields": {"Front": card.front, "Back": card.back},
-            "tags": card.tags,
-        }
+    return {
+        "deckName": card.deck or default_deck,
+        "modelName": _MODEL_NAMES[type(card)],
+        "fields": {name: highlight_code_blocks(value) for name, value in fields.items()},
+        "tags": card.tags,
+    }
 
-        # Auto-highlight code blocks in all fields
-        for field_name in note["fields"]:
-            note["fields"][field_name] = highlight_code_blocks(note["fields"][field_name])
 
-        note_id = await client.add_note(note)
+@app.tool()
+@with_anki_error_handling
+async def create_cards_batch(
+    cards: list[dict],
+    deck: str | None = None,
+    source: str | None = None,
+) -> CallToolResult:
+    """Create multiple flashcards in a single batch.
 
-        # Log to database
-        db = get_database()
-        generation_id = db.create_generation(source_type="manual")
-        db.add_generated_card(
-            generation_id=generation_id,
-            anki_note_id=note_id,
-            card_type="type_in",
-            front_or_text=card.front,
-            back=card.back,
-            deck=deck or settings.default_deck,
-            tags=card.tags,
-        )
+    Batch counterpart to the create_*_card tools: the whole batch goes to
+    AnkiConnect as one addNotes call and is logged to the history database
+    in one transaction, instead of paying a network and database roundtrip
+    per card. Prefer this tool whenever creating more than a couple of cards.
 
-        # Build response message
-        msg = f"Type-in card created successfully (Anki note ID: {note_id})\n\nDeck: {card.deck}"
+    Args:
+        cards: List of card dictionaries. Each needs a "card_type" key
+               ("basic", "cloze", or "type_in"; defaults to "basic") plus
+               that type's fields (front/back, or text/extra for cloze).
+               Optional per-card "tags" and "deck" keys are honored.
+        deck: Default deck for cards that do not specify one (falls back to
+              the configured default deck)
+        source: Source of the batch (PDF filename, URL, etc.), recorded in
+                the generation history
 
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
+    Returns:
+        Summary of created cards with note IDs, or error message
 
-    except AnkiConnectionError as e:
-        return CallToolResult(
-            isError=True,
-            content=[
-                TextContent(
-                    type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
-                )
+    Examples:
+        Mixed-type batch:
+        >>> create_cards_batch(
+        ...     cards=[
+        ...         {"front": "Capital of France?", "back": "Paris"},
+        ...         {"card_type": "cloze", "text": "{{c1::Paris}} is in France."},
+        ...     ],
+        ...     deck="Geography",
+        ... )
+    """
+    if not cards:
+        return CallToolResult(isError=True, content=[_ERR_NO_CARDS])
+
+    batch = CardBatch(cards=cards, deck=deck or settings.default_deck, source=source)
+    validated = validate_card_batch(batch)
+
+    # Structural cloze check, same as create_cloze_card
+    for index, card in enumerate(validated):
+        if isinstance(card, ClozeCard) and not find_cloze_numbers(card.text):
+            return CallToolResult(
+                isError=True,
+                content=[
+                    TextContent(
+                        type="text",
+                        text=f"Card {index}: cloze card must contain at least one "
+                        "cloze deletion in {{c1::text}} format.",
+                    )
+                ],
+            )
+
+    notes = [_note_payload(card, batch.deck) for card in validated]
+
+    client = get_anki_client()
+    note_ids = await client.add_notes(notes)
+    invalidate_deck_reports()
+
+    created = [
+        (index, card, note_id)
+        for index, (card, note_id) in enumerate(zip(validated, note_ids))
+        if note_id is not None
+    ]
+    failed_indices = [index for index, note_id in enumerate(note_ids) if note_id is None]
+
+    # Log the whole batch to the database in one transaction
+    if created:
+        db = get_database()
+        db.create_generation_with_cards(
+            source_type="manual",
+            source_path=source,
+            cards=[
+                {
+                    "anki_note_id": note_id,
+                    "card_type": _CARD_TYPES[type(card)],
+                    "front_or_text": (card.text if isinstance(card, ClozeCard) else card.front),
+                    "back": None if isinstance(card, ClozeCard) else card.back,
+                    "deck": card.deck or batch.deck,
+                    "tags": card.tags,
+                }
+                for _, card, note_id in created
             ],
         )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
+
+    parts = [f"Batch created {len(created)} of {len(validated)} cards " f"(deck: {batch.deck})"]
+    if created:
+        id_preview = ", ".join(str(note_id) for _, _, note_id in created[:10])
+        if len(created) > 10:
+            id_preview += ", ..."
+        parts.append(f"Note IDs: {id_preview}")
+    if failed_indices:
+        parts.append(
+            f"Failed cards (likely duplicates): indices "
+            f"{', '.join(str(i) for i in failed_indices)}"
         )
 
+    return CallToolResult(
+        content=[TextContent(type="text", text="\n\n".join(parts))],
+        isError=not created,
+    )
+
 
 @app.tool()
+@with_anki_error_handling
 async def update_card_tags(
     note_id: int,
     tags_to_add: list[str] | None = None,
@@ -411,68 +527,80 @@ async def update_card_tags(
         ...     tags_to_remove=["deprecated"]
         ... )
     """
-    try:
-        # Validate inputs
-        if not tags_to_add and not tags_to_remove:
-            return CallToolResult(
-                isError=True,
-                content=[
-                    TextContent(
-                        type="text",
-                        text="At least one of tags_to_add or tags_to_remove must be provided.",
-                    )
-                ],
-            )
-
-        client = get_anki_client()
-
-        # Add tags if requested
-        if tags_to_add:
-            tags_str = " ".join(tags_to_add)
-            await client.add_tags([note_id], tags_str)
-
-        # Remove tags if requested
-        if tags_to_remove:
-            tags_str = " ".join(tags_to_remove)
-            await client.remove_tags([note_id], tags_str)
-
-        # Get updated tags
-        updated_tags = await client.get_note_tags(note_id)
-
-        # Build response message
-        msg = f"Tags updated successfully for note ID {note_id}\n\n"
-
-        if tags_to_add:
-            msg += f"Added tags: {', '.join(tags_to_add)}\n"
-        if tags_to_remove:
-            msg += f"Removed tags: {', '.join(tags_to_remove)}\n"
-
-        msg += f"\nCurrent tags: {', '.join(updated_tags) if updated_tags else '(no tags)'}"
-
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-    except AnkiConnectionError as e:
+    # Validate inputs
+    if not tags_to_add and not tags_to_remove:
+        return CallToolResult(isError=True, content=[_ERR_NEED_TAG_OP])
+
+    client = get_anki_client()
+
+    # The tag read and both mutations go to AnkiConnect as one multi
+    # action - a single HTTP round trip instead of up to three - and the
+    # final tag set is computed locally. The local merge is
+    # order-independent: whether the read lands before or after the
+    # mutations, unioning the additions and subtracting the removals
+    # yields the post-mutation state.
+    actions = [{"action": "notesInfo", "params": {"notes": [note_id]}}]
+    if tags_to_add:
+        actions.append(
+            {"action": "addTags", "params": {"notes": [note_id], "tags": " ".join(tags_to_add)}}
+        )
+    if tags_to_remove:
+        actions.append(
+            {
+                "action": "removeTags",
+                "params": {"notes": [note_id], "tags": " ".join(tags_to_remove)},
+            }
+        )
+    results = await client.multi(actions)
+    # Each sub-result is a {"result", "error"} envelope; invoke() raises on
+    # the error field for standalone calls, so multi's envelopes get the
+    # same treatment before any result is trusted
+    for entry in results:
+        if isinstance(entry, dict) and entry.get("error"):
+            raise AnkiAPIError(entry["error"])
+    first = results[0]
+    note_info = first.get("result") if isinstance(first, dict) else first
+
+    # notesInfo reports a missing note as an empty entry, not an error
+    if not note_info or not note_info[0]:
         return CallToolResult(
             isError=True,
             content=[
                 TextContent(
                     type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
+                    text=f"Note ID {note_id} not found. Tags were not updated.",
                 )
             ],
         )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+
+    # The mutations landed, so cached analysis reports (which include tag
+    # data) are stale
+    invalidate_deck_reports()
+
+    existing = note_info[0].get("tags", [])
+    removed = set(tags_to_remove or ())
+    updated_tags = [tag for tag in existing if tag not in removed]
+    seen = set(updated_tags)
+    for tag in tags_to_add or ():
+        if tag not in seen and tag not in removed:
+            updated_tags.append(tag)
+            seen.add(tag)
+
+    # Build response as parts and join once - linear instead of quadratic
+    parts = [f"Tags updated successfully for note ID {note_id}\n"]
+
+    if tags_to_add:
+        parts.append(f"Added tags: {', '.join(tags_to_add)}")
+    if tags_to_remove:
+        parts.append(f"Removed tags: {', '.join(tags_to_remove)}")
+
+    parts.append(f"\nCurrent tags: {', '.join(updated_tags) if updated_tags else '(no tags)'}")
+
+    return CallToolResult(content=[TextContent(type="text", text="\n".join(parts))])
 
 
 @app.tool()
+@with_anki_error_handling
 async def delete_card(note_id: int) -> CallToolResult:
     """Delete an Anki card (note) permanently.
 
@@ -489,56 +617,38 @@ async def delete_card(note_id: int) -> CallToolResult:
         Delete a single card:
         >>> delete_card(note_id=1768502042387)
     """
-    try:
-        client = get_anki_client()
-
-        # Verify note exists before deleting
-        note_info = await client.notes_info([note_id])
-        if not note_info or not note_info[0]:
-            return CallToolResult(
-                isError=True,
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Note ID {note_id} not found. It may have already been deleted.",
-                    )
-                ],
-            )
-
-        # Delete the note
-        await client.delete_notes([note_id])
+    client = get_anki_client()
 
-        return CallToolResult(
-            content=[
-                TextContent(
-                    type="text",
-                    text=f"Successfully deleted note ID {note_id}",
-                )
-            ]
-        )
-
-    except AnkiConnectionError as e:
+    # Verify note exists before deleting; findNotes returns just the ID,
+    # unlike notesInfo which would ship every field back only to be dropped
+    found = await client.find_notes(f"nid:{note_id}")
+    if not found:
         return CallToolResult(
             isError=True,
             content=[
                 TextContent(
                     type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
+                    text=f"Note ID {note_id} not found. It may have already been deleted.",
                 )
             ],
         )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+
+    # Delete the note
+    await client.delete_notes([note_id])
+    invalidate_deck_reports()
+
+    return CallToolResult(
+        content=[
+            TextContent(
+                type="text",
+                text=f"Successfully deleted note ID {note_id}",
+            )
+        ]
+    )
 
 
 @app.tool()
+@with_anki_error_handling
 async def inspect_card_structure(
     front: str | None = None,
     back: str | None = None,
@@ -579,98 +689,88 @@ async def inspect_card_structure(
         ...     card_type="cloze"
         ... )
     """
-    try:
-        # Validate card_type parameter
-        valid_types = ["basic", "cloze", "type_in"]
-        if card_type not in valid_types:
-            valid_list = ", ".join(valid_types)
+    # Validate card_type parameter
+    if card_type not in _VALID_CARD_TYPES:
+        return CallToolResult(
+            isError=True,
+            content=[
+                TextContent(
+                    type="text",
+                    text=f"Invalid card_type '{card_type}'. "
+                    f"Must be one of: {_VALID_CARD_TYPES_TEXT}",
+                )
+            ],
+        )
+
+    # Build structural analysis based on card type
+    structure: dict[str, str | int | float | bool | list[str]] = {
+        "card_type": card_type,
+    }
+
+    if card_type in ["basic", "type_in"]:
+        if not front or not back:
             return CallToolResult(
                 isError=True,
                 content=[
                     TextContent(
                         type="text",
-                        text=f"Invalid card_type '{card_type}'. Must be one of: {valid_list}",
+                        text=f"For {card_type} cards, both 'front' and 'back' "
+                        "parameters are required.",
                     )
                 ],
             )
 
-        # Build structural analysis based on card type
-        structure: dict[str, str | int | float | bool | list[str]] = {
-            "card_type": card_type,
-        }
-
-        if card_type in ["basic", "type_in"]:
-            if not front or not back:
-                return CallToolResult(
-                    isError=True,
-                    content=[
-                        TextContent(
-                            type="text",
-                            text=f"For {card_type} cards, both 'front' and 'back' "
-                            "parameters are required.",
-                        )
-                    ],
-                )
-
-            # Front field analysis
-            front_plain = strip_html(front)
-            front_words = len(front_plain.split())
-            structure["front_word_count"] = front_words
-            structure["front_char_count"] = get_text_length(front)
-            structure["front_has_html"] = front != front_plain
-            structure["front_has_question_mark"] = "?" in front
-
-            # Back field analysis
-            back_plain = strip_html(back)
-            back_words = len(back_plain.split())
-            structure["back_word_count"] = back_words
-            structure["back_char_count"] = get_text_length(back)
-            structure["back_has_html"] = back != back_plain
-
-        elif card_type == "cloze":
-            if not text:
-                return CallToolResult(
-                    isError=True,
-                    content=[
-                        TextContent(
-                            type="text",
-                            text="For cloze cards, the 'text' parameter is required.",
-                        )
-                    ],
-                )
+        # Front field analysis
+        front_plain = strip_html(front)
+        structure["front_word_count"] = count_words(front_plain)
+        structure["front_char_count"] = len(front_plain)
+        structure["front_has_html"] = front != front_plain
+        structure["front_has_question_mark"] = "?" in front
+
+        # Back field analysis
+        back_plain = strip_html(back)
+        structure["back_word_count"] = count_words(back_plain)
+        structure["back_char_count"] = len(back_plain)
+        structure["back_has_html"] = back != back_plain
+
+    elif card_type == "cloze":
+        if not text:
+            return CallToolResult(
+                isError=True,
+                content=[
+                    TextContent(
+                        type="text",
+                        text="For cloze cards, the 'text' parameter is required.",
+                    )
+                ],
+            )
 
-            # Cloze analysis
-            cloze_deletions = re.findall(r"\{\{c(\d+)::", text)
-            unique_cloze_numbers = sorted(set(int(n) for n in cloze_deletions))
-            structure["cloze_count"] = len(cloze_deletions)
-            structure["unique_cloze_numbers"] = [str(n) for n in unique_cloze_numbers]
-            structure["has_valid_cloze_format"] = len(cloze_deletions) > 0
-
-            # Text analysis (without cloze syntax)
-            text_plain = strip_html(text.replace("{{", "").replace("}}", ""))
-            structure["text_word_count"] = len(text_plain.split())
-            structure["text_char_count"] = len(text_plain)
-            structure["text_has_html"] = text != strip_html(text)
-
-            # Extra field if provided
-            if extra:
-                extra_plain = strip_html(extra)
-                structure["extra_word_count"] = len(extra_plain.split())
-                structure["extra_has_html"] = extra != extra_plain
-
-        # Format response
-        msg = f"Card Structure Analysis ({card_type}):\n\n"
-        for key, value in structure.items():
-            readable_key = key.replace("_", " ").title()
-            msg += f"  {readable_key}: {value}\n"
-
-        msg += "\nThis is raw structural data. Use your judgment about quality "
-        msg += "based on the specific learning context and goals."
-
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
-
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+        # Cloze analysis
+        cloze_deletions = find_cloze_numbers(text)
+        unique_cloze_numbers = sorted(set(cloze_deletions))
+        structure["cloze_count"] = len(cloze_deletions)
+        structure["unique_cloze_numbers"] = [str(n) for n in unique_cloze_numbers]
+        structure["has_valid_cloze_format"] = len(cloze_deletions) > 0
+
+        # Text analysis - strip the HTML once, then drop the cloze syntax
+        text_stripped = strip_html(text)
+        text_plain = text_stripped.translate(_BRACE_TRANS)
+        structure["text_word_count"] = count_words(text_plain)
+        structure["text_char_count"] = len(text_plain)
+        structure["text_has_html"] = text != text_stripped
+
+        # Extra field if provided
+        if extra:
+            extra_plain = strip_html(extra)
+            structure["extra_word_count"] = count_words(extra_plain)
+            structure["extra_has_html"] = extra != extra_plain
+
+    # Format response as parts and join once - linear instead of quadratic
+    parts = [f"Card Structure Analysis ({card_type}):\n\n"]
+    parts.extend(f"  {_READABLE_KEYS[key]}: {value}\n" for key, value in structure.items())
+    parts.append(
+        "\nThis is raw structural data. Use your judgment about quality "
+        "based on the specific learning context and goals."
+    )
+
+    return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
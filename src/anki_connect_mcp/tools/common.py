@@ -0,0 +1,94 @@
+"""Shared helpers for MCP tool modules."""
+
+import asyncio
+import logging
+from functools import wraps
+
+from mcp.types import CallToolResult, TextContent
+
+from ..client import AnkiConnectionError
+
+logger = logging.getLogger(__name__)
+
+# History writes are bookkeeping, not part of a tool's answer, so they run as
+# fire-and-forget tasks off the response path. The set keeps a strong
+# reference to each in-flight task (create_task results are otherwise
+# garbage-collectable); the done callback drops it and logs any failure,
+# which would otherwise be discarded along with the task.
+_bg_tasks: set[asyncio.Task] = set()
+
+
+def _finish_bg_task(task: asyncio.Task) -> None:
+    """Drop a finished background task and log its failure, if any."""
+    _bg_tasks.discard(task)
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Background database write failed: %s", exc, exc_info=exc)
+
+
+async def drain_bg_tasks() -> None:
+    """Await every pending background write.
+
+    Called from the server's shutdown path so queued history rows reach the
+    database before the process exits. Failures are logged by the done
+    callback; this only waits, it does not re-raise.
+    """
+    while _bg_tasks:
+        await asyncio.gather(*_bg_tasks, return_exceptions=True)
+
+
+def run_db_write_in_background(write, /, **kwargs) -> None:
+    """Run a database write without blocking the tool response.
+
+    The write runs in a worker thread so the event loop can return the tool
+    response immediately; a failed write only loses a history row, and the
+    done callback logs it. Callers must pass a bound method of a background
+    Database (get_background_database) - its cursor has its own transaction
+    context, so the write cannot collide with a transaction open on the
+    shared singleton connection or on another in-flight background write.
+
+    Args:
+        write: Bound Database method to run
+        **kwargs: Arguments forwarded to the write
+    """
+    task = asyncio.create_task(asyncio.to_thread(write, **kwargs))
+    _bg_tasks.add(task)
+    task.add_done_callback(_finish_bg_task)
+
+
+def with_anki_error_handling(func):
+    """Convert AnkiConnect failures into the standard error results.
+
+    Every tool ended in the same two except blocks; applying them once here
+    (between @app.tool() and the function) keeps the tool bodies to their
+    actual logic. wraps preserves the signature and docstring that FastMCP
+    introspects for the tool schema.
+    """
+
+    @wraps(func)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await func(*args, **kwargs)
+        except AnkiConnectionError as e:
+            return CallToolResult(
+                isError=True,
+                content=[
+                    TextContent(
+                        type="text",
+                        text=(
+                            "Failed to connect to Anki. "
+                            "Is Anki running with AnkiConnect installed?\n\n"
+                            f"Error: {str(e)}"
+                        ),
+                    )
+                ],
+            )
+        except Exception as e:
+            return CallToolResult(
+                isError=True,
+                content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
+            )
+
+    return wrapper
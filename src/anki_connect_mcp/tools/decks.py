@@ -1,12 +1,17 @@
 """MCP tools for managing Anki decks."""
 
+import asyncio
+
 from mcp.types import CallToolResult, TextContent
 
-from ..client import AnkiConnectionError, get_anki_client
+from ..client import get_anki_client
 from ..server import app
+from .analysis import invalidate_deck_reports
+from .common import with_anki_error_handling
 
 
 @app.tool()
+@with_anki_error_handling
 async def list_decks() -> CallToolResult:
     """List all available Anki decks.
 
@@ -25,45 +30,25 @@ async def list_decks() -> CallToolResult:
         - Biology::Genetics
         - Chemistry
     """
-    try:
-        client = get_anki_client()
-        deck_names = await client.deck_names()
-
-        if not deck_names:
-            return CallToolResult(
-                content=[TextContent(type="text", text="No decks found in Anki collection.")]
-            )
-
-        # Sort decks alphabetically for better readability
-        deck_names_sorted = sorted(deck_names)
-
-        deck_list = "\n".join(f"- {name}" for name in deck_names_sorted)
-        message = f"Available decks ({len(deck_names_sorted)} total):\n\n{deck_list}"
+    client = get_anki_client()
+    # Sorted alphabetically for better readability; the client caches
+    # the sorted view so repeated listings don't re-sort
+    deck_names_sorted = await client.deck_names_sorted()
 
-        return CallToolResult(content=[TextContent(type="text", text=message)])
-
-    except AnkiConnectionError as e:
-        return CallToolResult(
-            isError=True,
-            content=[
-                TextContent(
-                    type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
-                )
-            ],
-        )
-    except Exception as e:
+    if not deck_names_sorted:
         return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
+            content=[TextContent(type="text", text="No decks found in Anki collection.")]
         )
 
+    # One join plus a prepended bullet instead of formatting each name
+    deck_list = "- " + "\n- ".join(deck_names_sorted)
+    message = f"Available decks ({len(deck_names_sorted)} total):\n\n{deck_list}"
+
+    return CallToolResult(content=[TextContent(type="text", text=message)])
+
 
 @app.tool()
+@with_anki_error_handling
 async def create_deck(name: str) -> CallToolResult:
     """Create a new Anki deck.
 
@@ -81,68 +66,46 @@ async def create_deck(name: str) -> CallToolResult:
         >>> create_deck("Biology::Molecular Biology")
         Deck created successfully: Biology::Molecular Biology (ID: 1234567890)
     """
-    try:
-        # Validate deck name
-        if not name or not name.strip():
-            return CallToolResult(
-                isError=True,
-                content=[TextContent(type="text", text="Deck name cannot be empty.")],
-            )
-
-        name = name.strip()
-
-        # Check if deck already exists
-        client = get_anki_client()
-        existing_decks = await client.deck_names()
-
-        if name in existing_decks:
-            return CallToolResult(
-                isError=True,
-                content=[
-                    TextContent(
-                        type="text",
-                        text=(
-                            f"Deck '{name}' already exists. "
-                            "Use a different name or manage the existing deck."
-                        ),
-                    )
-                ],
-            )
-
-        # Create deck
-        deck_id = await client.create_deck(name)
-
-        message = f"Deck created successfully: {name} (ID: {deck_id})"
-
-        # Add helpful note about hierarchy if deck name contains ::
-        if "::" in name:
-            parts = name.split("::")
-            message += f"\n\nHierarchy: {' → '.join(parts)}"
+    # Validate deck name
+    name = (name or "").strip()
+    if not name:
+        return CallToolResult(
+            isError=True,
+            content=[TextContent(type="text", text="Deck name cannot be empty.")],
+        )
 
-        return CallToolResult(content=[TextContent(type="text", text=message)])
+    # The existence check and the create share one round trip; the
+    # names list reflects the collection before the create, so a
+    # duplicate is still reported as such
+    client = get_anki_client()
+    existing_decks, deck_id = await client.create_deck_with_names(name)
 
-    except AnkiConnectionError as e:
+    if name in existing_decks:
         return CallToolResult(
             isError=True,
             content=[
                 TextContent(
                     type="text",
                     text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
+                        f"Deck '{name}' already exists. "
+                        "Use a different name or manage the existing deck."
                     ),
                 )
             ],
         )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+
+    message = f"Deck created successfully: {name} (ID: {deck_id})"
+
+    # Add helpful note about hierarchy if deck name contains ::
+    parts = name.split("::")
+    if len(parts) > 1:
+        message += f"\n\nHierarchy: {' → '.join(parts)}"
+
+    return CallToolResult(content=[TextContent(type="text", text=message)])
 
 
 @app.tool()
+@with_anki_error_handling
 async def delete_deck(deck_name: str) -> CallToolResult:
     """Delete an Anki deck and all its cards permanently.
 
@@ -159,70 +122,49 @@ async def delete_deck(deck_name: str) -> CallToolResult:
         >>> delete_deck("Scratch::Temp Notes")
         Successfully deleted deck 'Scratch::Temp Notes' and all its cards.
     """
-    try:
-        if not deck_name or not deck_name.strip():
-            return CallToolResult(
-                isError=True,
-                content=[TextContent(type="text", text="Deck name cannot be empty.")],
-            )
-
-        deck_name = deck_name.strip()
-
-        # Verify deck exists
-        client = get_anki_client()
-        existing_decks = await client.deck_names()
-
-        if deck_name not in existing_decks:
-            suggestions = [d for d in existing_decks if deck_name.lower() in d.lower()]
-            error_msg = f"Deck '{deck_name}' not found."
-
-            if suggestions:
-                error_msg += "\n\nDid you mean one of these?"
-                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions[:5])
-            else:
-                error_msg += "\n\nUse list_decks to see all available decks."
+    deck_name = (deck_name or "").strip()
+    if not deck_name:
+        return CallToolResult(
+            isError=True,
+            content=[TextContent(type="text", text="Deck name cannot be empty.")],
+        )
 
-            return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
+    # Verify deck exists
+    client = get_anki_client()
 
-        # Refuse to delete Default deck
-        if deck_name == "Default":
-            return CallToolResult(
-                isError=True,
-                content=[TextContent(type="text", text="Cannot delete the Default deck.")],
-            )
+    if not await client.has_deck(deck_name):
+        suggestions = await client.suggest_decks(deck_name)
+        error_msg = f"Deck '{deck_name}' not found."
 
-        await client.delete_decks([deck_name], cards_too=True)
+        if suggestions:
+            error_msg += "\n\nDid you mean one of these?"
+            error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions)
+        else:
+            error_msg += "\n\nUse list_decks to see all available decks."
 
-        return CallToolResult(
-            content=[
-                TextContent(
-                    type="text", text=f"Successfully deleted deck '{deck_name}' and all its cards."
-                )
-            ]
-        )
+        return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
 
-    except AnkiConnectionError as e:
-        return CallToolResult(
-            isError=True,
-            content=[
-                TextContent(
-                    type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
-                )
-            ],
-        )
-    except Exception as e:
+    # Refuse to delete Default deck
+    if deck_name == "Default":
         return CallToolResult(
             isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
+            content=[TextContent(type="text", text="Cannot delete the Default deck.")],
         )
 
+    await client.delete_decks([deck_name], cards_too=True)
+    invalidate_deck_reports()
+
+    return CallToolResult(
+        content=[
+            TextContent(
+                type="text", text=f"Successfully deleted deck '{deck_name}' and all its cards."
+            )
+        ]
+    )
+
 
 @app.tool()
+@with_anki_error_handling
 async def get_deck_stats(deck_name: str) -> CallToolResult:
     """Get statistics for an Anki deck.
 
@@ -244,86 +186,75 @@ async def get_deck_stats(deck_name: str) -> CallToolResult:
         Review: 128
         Total cards: 185
     """
-    try:
-        # Validate deck name
-        if not deck_name or not deck_name.strip():
-            return CallToolResult(
-                isError=True,
-                content=[TextContent(type="text", text="Deck name cannot be empty.")],
-            )
-
-        deck_name = deck_name.strip()
-
-        # Check if deck exists
-        client = get_anki_client()
-        existing_decks = await client.deck_names()
-
-        if deck_name not in existing_decks:
-            # Provide helpful suggestions
-            suggestions = [d for d in existing_decks if deck_name.lower() in d.lower()]
-            error_msg = f"Deck '{deck_name}' not found."
-
-            if suggestions:
-                error_msg += "\n\nDid you mean one of these?"
-                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions[:5])
-            else:
-                error_msg += "\n\nUse list_decks to see all available decks."
-
-            return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
-
-        # Get deck statistics
-        stats = await client.get_deck_stats(deck_name)
-
-        # Extract stats from the response
-        # AnkiConnect returns a dict with deck ID as key (single-item dict when querying one deck)
-        deck_stats = next(iter(stats.values()), {})
-
-        if not deck_stats:
-            return CallToolResult(
-                isError=True,
-                content=[
-                    TextContent(
-                        type="text",
-                        text=f"Unable to retrieve statistics for deck '{deck_name}'.",
-                    )
-                ],
-            )
-
-        # Format the statistics
-        new_count = deck_stats.get("new_count", 0)
-        learn_count = deck_stats.get("learn_count", 0)
-        review_count = deck_stats.get("review_count", 0)
-        total_cards = deck_stats.get("total_in_deck", 0)
-
-        message = f"Statistics for deck: {deck_name}\n\n"
-        message += f"New cards: {new_count}\n"
-        message += f"Learning: {learn_count}\n"
-        message += f"Review: {review_count}\n"
-        message += f"Total cards: {total_cards}"
-
-        # Add workload assessment
-        daily_workload = new_count + learn_count + review_count
-        if daily_workload > 0:
-            message += f"\n\nToday's workload: {daily_workload} cards"
-
-        return CallToolResult(content=[TextContent(type="text", text=message)])
+    # Validate deck name
+    deck_name = (deck_name or "").strip()
+    if not deck_name:
+        return CallToolResult(
+            isError=True,
+            content=[TextContent(type="text", text="Deck name cannot be empty.")],
+        )
 
-    except AnkiConnectionError as e:
+    # Fetch the deck list and the statistics concurrently; the stats
+    # call is speculative and its failure only matters if the deck
+    # turns out to exist
+    client = get_anki_client()
+    deck_exists, stats = await asyncio.gather(
+        client.has_deck(deck_name),
+        client.get_deck_stats(deck_name),
+        return_exceptions=True,
+    )
+    if isinstance(deck_exists, BaseException):
+        raise deck_exists
+
+    if not deck_exists:
+        # Provide helpful suggestions
+        suggestions = await client.suggest_decks(deck_name)
+        error_msg = f"Deck '{deck_name}' not found."
+
+        if suggestions:
+            error_msg += "\n\nDid you mean one of these?"
+            error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions)
+        else:
+            error_msg += "\n\nUse list_decks to see all available decks."
+
+        return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
+
+    if isinstance(stats, BaseException):
+        raise stats
+
+    # Extract stats from the response
+    # AnkiConnect returns a dict with deck ID as key (single-item dict when querying one deck)
+    deck_stats = next(iter(stats.values()), {})
+
+    if not deck_stats:
         return CallToolResult(
             isError=True,
             content=[
                 TextContent(
                     type="text",
-                    text=(
-                        "Failed to connect to Anki. "
-                        "Is Anki running with AnkiConnect installed?\n\n"
-                        f"Error: {str(e)}"
-                    ),
+                    text=f"Unable to retrieve statistics for deck '{deck_name}'.",
                 )
             ],
         )
-    except Exception as e:
-        return CallToolResult(
-            isError=True,
-            content=[TextContent(type="text", text=f"Unexpected error: {str(e)}")],
-        )
+
+    # Format the statistics
+    new_count = deck_stats.get("new_count", 0)
+    learn_count = deck_stats.get("learn_count", 0)
+    review_count = deck_stats.get("review_count", 0)
+    total_cards = deck_stats.get("total_in_deck", 0)
+
+    lines = [
+        f"Statistics for deck: {deck_name}",
+        "",
+        f"New cards: {new_count}",
+        f"Learning: {learn_count}",
+        f"Review: {review_count}",
+        f"Total cards: {total_cards}",
+    ]
+
+    # Add workload assessment
+    daily_workload = new_count + learn_count + review_count
+    if daily_workload > 0:
+        lines.append(f"\nToday's workload: {daily_workload} cards")
+
+    return CallToolResult(content=[TextContent(type="text", text="\n".join(lines))])
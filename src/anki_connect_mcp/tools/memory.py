@@ -46,7 +46,11 @@ async def store_card_rationale(
     """
     try:
         db = get_database()
-        alternatives_json = json.dumps(alternatives_considered) if alternatives_considered else None
+        alternatives_json = (
+            json.dumps(alternatives_considered, separators=(",", ":"), ensure_ascii=False)
+            if alternatives_considered
+            else None
+        )
 
         rationale_id = db.store_card_rationale(
             anki_note_id=anki_note_id,
@@ -186,6 +190,74 @@ async def link_card_to_concept(
         )
 
 
+@app.tool()
+async def link_cards_to_concepts(links: list[dict]) -> CallToolResult:
+    """Link multiple cards to concepts in a single batch.
+
+    Batch counterpart to link_card_to_concept: every link is written to the
+    database in one transaction instead of paying a tool call and a commit
+    per link. Prefer this after creating several cards at once.
+
+    Args:
+        links: List of link dicts, each with:
+            - anki_note_id (int, required): Anki note ID of the card
+            - concept_name (str, required): Name of the concept
+            - deck (str, required): Deck the concept belongs to
+            - relationship (str, optional): Type of relationship (e.g., 'defines',
+              'examples', 'contrasts', 'applies', 'extends')
+            - concept_description (str, optional): Description if creating a new concept
+
+    Returns:
+        Confirmation message
+
+    Examples:
+        >>> link_cards_to_concepts(links=[
+        ...     {"anki_note_id": 1234567890, "concept_name": "EHR Interoperability",
+        ...      "deck": "Health Informatics::Module 02", "relationship": "defines"},
+        ...     {"anki_note_id": 1234567891, "concept_name": "HIPAA Compliance",
+        ...      "deck": "Health Informatics::Module 02"},
+        ... ])
+    """
+    try:
+        if not links:
+            return CallToolResult(
+                isError=True,
+                content=[TextContent(type="text", text="No links provided.")],
+            )
+
+        missing = [
+            i
+            for i, link in enumerate(links)
+            if not all(key in link for key in ("anki_note_id", "concept_name", "deck"))
+        ]
+        if missing:
+            return CallToolResult(
+                isError=True,
+                content=[
+                    TextContent(
+                        type="text",
+                        text=(
+                            "Each link needs anki_note_id, concept_name, and deck. "
+                            f"Missing in entries: {missing}"
+                        ),
+                    )
+                ],
+            )
+
+        db = get_database()
+        count = db.link_cards_to_concepts(links)
+
+        concept_count = len({(link["deck"], link["concept_name"]) for link in links})
+        msg = f"Linked {count} cards to {concept_count} concepts"
+        return CallToolResult(content=[TextContent(type="text", text=msg)])
+
+    except Exception as e:
+        return CallToolResult(
+            isError=True,
+            content=[TextContent(type="text", text=f"Failed to link cards to concepts: {str(e)}")],
+        )
+
+
 @app.tool()
 async def get_concept_coverage(deck: str) -> CallToolResult:
     """Get concept coverage for a deck.
@@ -211,45 +283,41 @@ async def get_concept_coverage(deck: str) -> CallToolResult:
             msg += "Start tracking coverage by using link_card_to_concept() after creating cards."
             return CallToolResult(content=[TextContent(type="text", text=msg)])
 
-        msg = f"Concept Coverage for '{deck}':\n\n"
+        parts = [f"Concept Coverage for '{deck}':\n\n"]
 
-        # Group by coverage level
-        well_covered = []
-        sparse = []
-        uncovered = []
+        # Group by coverage level, formatting each line as it is bucketed
+        well_covered: list[str] = []
+        sparse: list[str] = []
+        uncovered: list[str] = []
 
         for concept in concepts:
-            if concept["card_count"] >= 3:
-                well_covered.append(concept)
-            elif concept["card_count"] >= 1:
-                sparse.append(concept)
+            desc = f" - {concept['description']}" if concept["description"] else ""
+            count = concept["card_count"]
+            if count >= 3:
+                well_covered.append(f"  - {concept['name']}: {count} cards{desc}\n")
+            elif count >= 1:
+                sparse.append(f"  - {concept['name']}: {count} cards{desc}\n")
             else:
-                uncovered.append(concept)
+                uncovered.append(f"  - {concept['name']}{desc}\n")
 
         if well_covered:
-            msg += "Well Covered (3+ cards):\n"
-            for c in well_covered:
-                desc = f" - {c['description']}" if c["description"] else ""
-                msg += f"  - {c['name']}: {c['card_count']} cards{desc}\n"
-            msg += "\n"
+            parts.append("Well Covered (3+ cards):\n")
+            parts.extend(well_covered)
+            parts.append("\n")
 
         if sparse:
-            msg += "Sparse Coverage (1-2 cards):\n"
-            for c in sparse:
-                desc = f" - {c['description']}" if c["description"] else ""
-                msg += f"  - {c['name']}: {c['card_count']} cards{desc}\n"
-            msg += "\n"
+            parts.append("Sparse Coverage (1-2 cards):\n")
+            parts.extend(sparse)
+            parts.append("\n")
 
         if uncovered:
-            msg += "Defined but Uncovered (0 cards):\n"
-            for c in uncovered:
-                desc = f" - {c['description']}" if c["description"] else ""
-                msg += f"  - {c['name']}{desc}\n"
-            msg += "\n"
+            parts.append("Defined but Uncovered (0 cards):\n")
+            parts.extend(uncovered)
+            parts.append("\n")
 
-        msg += f"Total: {len(concepts)} concepts tracked"
+        parts.append(f"Total: {len(concepts)} concepts tracked")
 
-        return CallToolResult(content=[TextContent(type="text", text=msg)])
+        return CallToolResult(content=[TextContent(type="text", text="".join(parts))])
 
     except Exception as e:
         return CallToolResult(
@@ -338,23 +406,23 @@ async def get_session_context(deck: str, limit: int = 3) -> CallToolResult:
             msg += "Save context with save_session_context() at the end of this session."
             return CallToolResult(content=[TextContent(type="text", text=msg)])
 
-        msg = f"Previous Session Context for '{deck}':\n\n"
+        parts = [f"Previous Session Context for '{deck}':\n\n"]
 
         for i, session in enumerate(sessions, 1):
-            msg += f"--- Session {i} ({session['created_at']}) ---\n"
+            parts.append(f"--- Session {i} ({session['created_at']}) ---\n")
 
             if session["source_material"]:
-                msg += f"Source: {session['source_material']}\n"
+                parts.append(f"Source: {session['source_material']}\n")
             if session["learning_goals"]:
-                msg += f"Goals: {session['learning_goals']}\n"
+                parts.append(f"Goals: {session['learning_goals']}\n")
             if session["coverage_strategy"]:
-                msg += f"Strategy: {session['coverage_strategy']}\n"
+                parts.append(f"Strategy: {session['coverage_strategy']}\n")
             if session["observations"]:
-                msg += f"Observations: {session['observations']}\n"
+                parts.append(f"Observations: {session['observations']}\n")
 
-            msg += "\n"
+            parts.append("\n")
 
-        return CallToolResult(content=[TextContent(type="text", text=msg.strip())])
+        return CallToolResult(content=[TextContent(type="text", text="".join(parts).strip())])
 
     except Exception as e:
         return CallToolResult(
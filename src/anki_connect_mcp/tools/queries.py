@@ -1,5 +1,7 @@
 """MCP tools for querying and inspecting Anki cards."""
 
+import asyncio
+import re
 from collections import Counter
 
 from mcp.types import CallToolResult, TextContent
@@ -7,6 +9,11 @@ from mcp.types import CallToolResult, TextContent
 from ..client import AnkiConnectionError, get_anki_client
 from ..server import app
 
+# Formatting tags counted as "HTML usage" by preview_deck_patterns; one
+# compiled alternation scans a field in a single pass instead of one
+# substring search per tag
+_HTML_TAG_RE = re.compile(r"<(?:b|i|br|sub|sup|ul|ol)>")
+
 
 @app.tool()
 async def search_deck_cards(
@@ -52,23 +59,6 @@ async def search_deck_cards(
                 ],
             )
 
-        # Check if deck exists
-        client = get_anki_client()
-        existing_decks = await client.deck_names()
-
-        if deck_name not in existing_decks:
-            # Provide helpful suggestions
-            suggestions = [d for d in existing_decks if deck_name.lower() in d.lower()]
-            error_msg = f"Deck '{deck_name}' not found."
-
-            if suggestions:
-                error_msg += "\n\nDid you mean one of these?"
-                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions[:5])
-            else:
-                error_msg += "\n\nUse list_decks to see all available decks."
-
-            return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
-
         # Build Anki search query
         query_parts = [f'deck:"{deck_name}"']
 
@@ -81,8 +71,33 @@ async def search_deck_cards(
 
         query = " ".join(query_parts)
 
-        # Find cards
-        card_ids = await client.find_cards(query)
+        # Run the deck existence check and the search concurrently; the
+        # search is speculative and its failure only matters if the deck
+        # turns out to exist
+        client = get_anki_client()
+        deck_exists, card_ids = await asyncio.gather(
+            client.has_deck(deck_name),
+            client.find_cards(query),
+            return_exceptions=True,
+        )
+        if isinstance(deck_exists, BaseException):
+            raise deck_exists
+
+        if not deck_exists:
+            # Provide helpful suggestions
+            suggestions = await client.suggest_decks(deck_name)
+            error_msg = f"Deck '{deck_name}' not found."
+
+            if suggestions:
+                error_msg += "\n\nDid you mean one of these?"
+                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions)
+            else:
+                error_msg += "\n\nUse list_decks to see all available decks."
+
+            return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
+
+        if isinstance(card_ids, BaseException):
+            raise card_ids
 
         if not card_ids:
             msg = f"No cards found in deck '{deck_name}'"
@@ -116,19 +131,21 @@ async def search_deck_cards(
         showing_text = (
             f"showing {len(card_ids)}" if total_found > limit else f"showing all {len(card_ids)}"
         )
-        msg = f'Found {total_found} cards in deck "{deck_name}" ({showing_text})\n\n'
+        parts = [f'Found {total_found} cards in deck "{deck_name}" ({showing_text})\n\n']
 
         for idx, card in enumerate(cards_info, 1):
             note_id = card["note"]
-            note = note_map.get(note_id, {})
+            # note_ids came from this same cards_info, so the lookup
+            # always hits
+            note = note_map[note_id]
 
             model_name = note.get("modelName", "Unknown")
             note_tags = note.get("tags", [])
             fields = note.get("fields", {})
 
-            msg += f"Card {idx} - Note ID: {note_id}\n"
-            msg += f"Type: {model_name}\n"
-            msg += f"Tags: {', '.join(note_tags) if note_tags else '(no tags)'}\n"
+            parts.append(f"Card {idx} - Note ID: {note_id}\n")
+            parts.append(f"Type: {model_name}\n")
+            parts.append(f"Tags: {', '.join(note_tags) if note_tags else '(no tags)'}\n")
 
             # Preview fields based on note type
             if model_name == "Basic" or model_name == "Basic (type in the answer)":
@@ -139,24 +156,25 @@ async def search_deck_cards(
                 front_preview = (front[:80] + "...") if len(front) > 80 else front
                 back_preview = (back[:80] + "...") if len(back) > 80 else back
 
-                msg += f'Preview: "{front_preview}" → "{back_preview}"\n'
+                parts.append(f'Preview: "{front_preview}" → "{back_preview}"\n')
 
             elif model_name == "Cloze":
                 text = fields.get("Text", {}).get("value", "")
                 text_preview = (text[:100] + "...") if len(text) > 100 else text
-                msg += f'Text: "{text_preview}"\n'
+                parts.append(f'Text: "{text_preview}"\n')
 
             else:
-                # Generic handling for other note types
-                field_values = [f.get("value", "") for f in fields.values()]
-                if field_values:
-                    first_field = field_values[0]
+                # Generic handling for other note types: only the first
+                # field is previewed, so don't materialize the rest
+                first_field_data = next(iter(fields.values()), None)
+                if first_field_data is not None:
+                    first_field = first_field_data.get("value", "")
                     preview = (first_field[:100] + "...") if len(first_field) > 100 else first_field
-                    msg += f'Preview: "{preview}"\n'
+                    parts.append(f'Preview: "{preview}"\n')
 
-            msg += "\n"
+            parts.append("\n")
 
-        return CallToolResult(content=[TextContent(type="text", text=msg.strip())])
+        return CallToolResult(content=[TextContent(type="text", text="".join(parts).strip())])
 
     except AnkiConnectionError as e:
         return CallToolResult(
@@ -180,7 +198,7 @@ async def search_deck_cards(
 
 
 @app.tool()
-async def inspect_card(note_id: int) -> CallToolResult:
+async def inspect_card(note_id: int, max_field_chars: int = 2000) -> CallToolResult:
     """View complete details of a specific card.
 
     Displays all fields, tags, deck, and metadata for a single note.
@@ -188,6 +206,9 @@ async def inspect_card(note_id: int) -> CallToolResult:
 
     Args:
         note_id: The Anki note ID to inspect
+        max_field_chars: Maximum characters shown per field before truncation
+                         (default: 2000). Keeps fields with embedded images or
+                         large HTML from dominating the response.
 
     Returns:
         Complete card details, or error message
@@ -222,30 +243,39 @@ async def inspect_card(note_id: int) -> CallToolResult:
         note_tags = note.get("tags", [])
         fields = note.get("fields", {})
 
+        # Recent AnkiConnect versions return the note's card IDs in
+        # notesInfo; only older servers need the extra search
+        card_ids = note.get("cards")
+        if card_ids is None:
+            card_ids = await client.find_cards(f"nid:{note_id}")
+
         # Build response
-        msg = f"Note ID: {note_id}\n"
-        msg += f"Type: {model_name}\n"
+        parts = [f"Note ID: {note_id}\n", f"Type: {model_name}\n"]
 
         # Get deck name (from first card)
-        card_ids = await client.find_cards(f"nid:{note_id}")
         if card_ids:
             cards = await client.cards_info(card_ids)
             if cards:
-                msg += f"Deck: {cards[0].get('deckName', 'Unknown')}\n"
+                parts.append(f"Deck: {cards[0].get('deckName', 'Unknown')}\n")
 
-        msg += f"Tags: {', '.join(note_tags) if note_tags else '(no tags)'}\n\n"
+        parts.append(f"Tags: {', '.join(note_tags) if note_tags else '(no tags)'}\n\n")
 
         # Display fields
-        msg += "Fields:\n"
+        parts.append("Fields:\n")
         for field_name, field_data in fields.items():
             field_value = field_data.get("value", "")
-            msg += f"  {field_name}: {field_value}\n"
+            if len(field_value) > max_field_chars:
+                field_value = (
+                    field_value[:max_field_chars]
+                    + f"... ({len(field_value)} chars total, truncated)"
+                )
+            parts.append(f"  {field_name}: {field_value}\n")
 
         # Show card generation info
         if card_ids:
-            msg += f"\nCards Generated: {len(card_ids)}\n"
+            parts.append(f"\nCards Generated: {len(card_ids)}\n")
 
-        return CallToolResult(content=[TextContent(type="text", text=msg.strip())])
+        return CallToolResult(content=[TextContent(type="text", text="".join(parts).strip())])
 
     except AnkiConnectionError as e:
         return CallToolResult(
@@ -307,24 +337,32 @@ async def preview_deck_patterns(
                 ],
             )
 
-        # Check if deck exists
+        # Run the deck existence check and the card search concurrently;
+        # the search is speculative and its failure only matters if the
+        # deck turns out to exist
         client = get_anki_client()
-        existing_decks = await client.deck_names()
+        deck_exists, card_ids = await asyncio.gather(
+            client.has_deck(deck_name),
+            client.find_cards(f'deck:"{deck_name}"'),
+            return_exceptions=True,
+        )
+        if isinstance(deck_exists, BaseException):
+            raise deck_exists
 
-        if deck_name not in existing_decks:
-            suggestions = [d for d in existing_decks if deck_name.lower() in d.lower()]
+        if not deck_exists:
+            suggestions = await client.suggest_decks(deck_name)
             error_msg = f"Deck '{deck_name}' not found."
 
             if suggestions:
                 error_msg += "\n\nDid you mean one of these?"
-                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions[:5])
+                error_msg += "\n" + "\n".join(f"- {s}" for s in suggestions)
             else:
                 error_msg += "\n\nUse list_decks to see all available decks."
 
             return CallToolResult(isError=True, content=[TextContent(type="text", text=error_msg)])
 
-        # Find all cards in deck
-        card_ids = await client.find_cards(f'deck:"{deck_name}"')
+        if isinstance(card_ids, BaseException):
+            raise card_ids
 
         if not card_ids:
             return CallToolResult(
@@ -350,7 +388,8 @@ async def preview_deck_patterns(
         model_counter = Counter()
         tag_counter: Counter[str] = Counter()
         html_usage = 0
-        field_lengths = []
+        field_length_total = 0
+        field_count = 0
 
         for note in notes_info:
             model_name = note.get("modelName", "Unknown")
@@ -361,90 +400,83 @@ async def preview_deck_patterns(
             for tag in tags:
                 tag_counter[tag] += 1
 
-            # Analyze fields
-            fields = note.get("fields", {})
-            for field_data in fields.values():
-                field_value = field_data.get("value", "")
-
-                # Check for HTML
-                if any(
-                    tag in field_value
-                    for tag in ["<b>", "<i>", "<br>", "<sub>", "<sup>", "<ul>", "<ol>"]
-                ):
-                    html_usage += 1
-                    break  # Count once per note
-
-                field_lengths.append(len(field_value))
+            # Analyze fields: HTML counts once per note, but every field
+            # contributes to the length average. The old loop broke out at
+            # the first HTML hit, dropping the remaining fields' lengths
+            # and skewing the average toward HTML-free notes.
+            values = [field_data.get("value", "") for field_data in note.get("fields", {}).values()]
+            if any(_HTML_TAG_RE.search(value) for value in values):
+                html_usage += 1
+            field_length_total += sum(len(value) for value in values)
+            field_count += len(values)
 
         # Build response
-        msg = f'Deck Analysis: "{deck_name}"\n'
-        msg += f"Total Cards: {total_cards}\n\n"
+        parts = [f'Deck Analysis: "{deck_name}"\n', f"Total Cards: {total_cards}\n\n"]
 
         # Card type distribution
-        msg += "Card Type Distribution:\n"
+        parts.append("Card Type Distribution:\n")
         for model, count in model_counter.most_common():
             percentage = (count / len(notes_info)) * 100
-            msg += f"- {model}: {count} ({percentage:.0f}%)\n"
-        msg += "\n"
+            parts.append(f"- {model}: {count} ({percentage:.0f}%)\n")
+        parts.append("\n")
 
         # Common tags
         if tag_counter:
-            msg += f"Common Tags (top {min(5, len(tag_counter))}):\n"
+            parts.append(f"Common Tags (top {min(5, len(tag_counter))}):\n")
             for idx, (tag, count) in enumerate(tag_counter.most_common(5), 1):
-                msg += f"{idx}. {tag} ({count} cards)\n"
-            msg += "\n"
+                parts.append(f"{idx}. {tag} ({count} cards)\n")
+            parts.append("\n")
 
         # Formatting patterns
-        msg += "Formatting Patterns:\n"
+        parts.append("Formatting Patterns:\n")
         if html_usage > 0:
             html_percentage = (html_usage / len(notes_info)) * 100
-            msg += f"- {html_percentage:.0f}% of cards use HTML formatting\n"
+            parts.append(f"- {html_percentage:.0f}% of cards use HTML formatting\n")
         else:
-            msg += "- No HTML formatting detected in sample\n"
+            parts.append("- No HTML formatting detected in sample\n")
 
-        if field_lengths:
-            avg_length = sum(field_lengths) / len(field_lengths)
-            msg += f"- Average field length: {avg_length:.0f} characters\n"
+        if field_count:
+            avg_length = field_length_total / field_count
+            parts.append(f"- Average field length: {avg_length:.0f} characters\n")
 
-        msg += f"\nSample Cards (showing {len(notes_info)}):\n\n"
+        parts.append(f"\nSample Cards (showing {len(notes_info)}):\n\n")
 
         # Show sample cards
         note_map = {note["noteId"]: note for note in notes_info}
 
         for idx, card in enumerate(cards_info[:sample_size], 1):
             note_id = card["note"]
-            note = note_map.get(note_id, {})
-
-            if not note:
-                continue
+            # note_ids came from this same cards_info, so the lookup
+            # always hits
+            note = note_map[note_id]
 
             model_name = note.get("modelName", "Unknown")
             note_tags = note.get("tags", [])
             fields = note.get("fields", {})
 
-            msg += f"[Card {idx}] {model_name}\n"
-            msg += f"Tags: {', '.join(note_tags) if note_tags else '(no tags)'}\n"
+            parts.append(f"[Card {idx}] {model_name}\n")
+            parts.append(f"Tags: {', '.join(note_tags) if note_tags else '(no tags)'}\n")
 
             # Show fields based on type
             if model_name == "Basic" or model_name == "Basic (type in the answer)":
                 front = fields.get("Front", {}).get("value", "")
                 back = fields.get("Back", {}).get("value", "")
-                msg += f"Front: {front}\n"
-                msg += f"Back: {back}\n"
+                parts.append(f"Front: {front}\n")
+                parts.append(f"Back: {back}\n")
 
             elif model_name == "Cloze":
                 text = fields.get("Text", {}).get("value", "")
-                msg += f"Text: {text}\n"
+                parts.append(f"Text: {text}\n")
 
             else:
                 # Generic handling
                 for field_name, field_data in fields.items():
                     field_value = field_data.get("value", "")
-                    msg += f"{field_name}: {field_value}\n"
+                    parts.append(f"{field_name}: {field_value}\n")
 
-            msg += "\n"
+            parts.append("\n")
 
-        return CallToolResult(content=[TextContent(type="text", text=msg.strip())])
+        return CallToolResult(content=[TextContent(type="text", text="".join(parts).strip())])
 
     except AnkiConnectionError as e:
         return CallToolResult(
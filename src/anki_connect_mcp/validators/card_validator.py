@@ -31,33 +31,72 @@ class CardValidator:
             ClozeCountRule(),
             ContextRule(),
         ]
+        # Memoized results keyed by card content, so is_valid/get_errors/
+        # get_warnings/get_suggestions consulted for the same card run the
+        # rules once instead of once per accessor. Bounded by _MEMO_MAX;
+        # cleared wholesale rather than evicted since entries are tiny and
+        # repeat hits cluster within a single batch or report.
+        self._memo: dict[tuple, list[ValidationResult]] = {}
+
+    _MEMO_MAX = 512
+
+    @staticmethod
+    def _memo_key(card: BasicCard | ClozeCard | TypeInCard) -> tuple:
+        """Build the memo key from the card fields the rules read."""
+        return (
+            type(card).__name__,
+            getattr(card, "front", None),
+            getattr(card, "back", None),
+            getattr(card, "text", None),
+        )
 
     def validate(self, card: BasicCard | ClozeCard | TypeInCard) -> list[ValidationResult]:
         """Run all validation rules on a card.
 
+        Results are memoized by card content; callers must not mutate the
+        returned list.
+
         Args:
             card: Card to validate
 
         Returns:
             List of validation results
         """
-        results = []
-        for rule in self.rules:
-            rule_results = rule.check(card, self.strictness)
-            results.extend(rule_results)
+        key = self._memo_key(card)
+        results = self._memo.get(key)
+        if results is None:
+            results = []
+            for rule in self.rules:
+                rule_results = rule.check(card, self.strictness)
+                results.extend(rule_results)
+            if len(self._memo) >= self._MEMO_MAX:
+                self._memo.clear()
+            self._memo[key] = results
         return results
 
     def is_valid(self, card: BasicCard | ClozeCard | TypeInCard) -> bool:
         """Check if card passes validation (no errors).
 
+        Only rules whose max_severity is ERROR run here (currently just
+        ClozeFormatRule); memoized full results are reused when present.
+
         Args:
             card: Card to validate
 
         Returns:
             True if no ERROR severity results
         """
-        results = self.validate(card)
-        return not any(r.severity == ValidationSeverity.ERROR for r in results)
+        results = self._memo.get(self._memo_key(card))
+        if results is not None:
+            return not any(r.severity == ValidationSeverity.ERROR for r in results)
+
+        for rule in self.rules:
+            if rule.max_severity is not ValidationSeverity.ERROR:
+                continue
+            rule_results = rule.check(card, self.strictness)
+            if any(r.severity == ValidationSeverity.ERROR for r in rule_results):
+                return False
+        return True
 
     def get_errors(self, card: BasicCard | ClozeCard | TypeInCard) -> list[ValidationResult]:
         """Get only ERROR severity results.
@@ -96,13 +135,24 @@ class CardValidator:
         return [r for r in results if r.severity == ValidationSeverity.SUGGESTION]
 
 
+# Shared validator instances keyed by effective strictness. A validator is
+# stateless after construction, but building one instantiates all six rule
+# objects, so callers that validate per card (batch tools, quality analysis)
+# should not pay that cost per call.
+_validators: dict[str, CardValidator] = {}
+
+
 def get_validator(strictness: str | None = None) -> CardValidator:
-    """Get a card validator instance.
+    """Get the shared card validator for a strictness level.
 
     Args:
         strictness: Validation strictness level
 
     Returns:
-        CardValidator instance
+        CardValidator instance, shared across calls with the same strictness
     """
-    return CardValidator(strictness)
+    key = strictness or settings.validation_strictness
+    validator = _validators.get(key)
+    if validator is None:
+        validator = _validators[key] = CardValidator(key)
+    return validator
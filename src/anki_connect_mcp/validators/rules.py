@@ -2,14 +2,42 @@
 
 import re
 from abc import ABC, abstractmethod
+from typing import ClassVar
 
-from ..formatting import get_text_length, strip_html
-from ..models import BasicCard, ClozeCard, TypeInCard, ValidationResult, ValidationSeverity
+from ..formatting import find_cloze_numbers, get_text_length, strip_html
+from ..models import (
+    BasicCard,
+    CardField,
+    ClozeCard,
+    TypeInCard,
+    ValidationResult,
+    ValidationSeverity,
+)
+
+# Compiled once at import; per-card checks then skip the re module's
+# cache lookup and argument handling on every call
+_MALFORMED_CLOZE_RE = re.compile(r"\{\{[^c]|c\d+:[^:]|\{\{c\d+:[^\}]*$")
+
+# Deletes cloze braces in one C-level pass instead of two chained replaces
+_BRACE_TRANS = str.maketrans("", "", "{}")
+
+# Tokens suggesting a front asks for several things at once (list prompts,
+# conjunctions, comma-separated items); word boundaries keep words like
+# "understand" from matching "and"
+_MULTI_TRIGGER_RE = re.compile(r"\b(?:list|enumerate|and|or)\b|,")
+
+# Phrasings that usually make a question too vague to answer precisely;
+# the capture lets the diagnostic quote whichever one matched
+_VAGUE_RE = re.compile(r"(what about|tell me about|describe|explain everything|what do you know)")
 
 
 class ValidationRule(ABC):
     """Base class for validation rules."""
 
+    #: Highest severity this rule can emit; lets validity checks skip
+    #: rules that cannot produce errors
+    max_severity: ClassVar[ValidationSeverity] = ValidationSeverity.SUGGESTION
+
     @abstractmethod
     def check(
         self, card: BasicCard | ClozeCard | TypeInCard, strictness: str
@@ -28,6 +56,8 @@ class ValidationRule(ABC):
 class AnswerLengthRule(ValidationRule):
     """Ensure answers aren't too long (violates minimum information principle)."""
 
+    max_severity = ValidationSeverity.WARNING
+
     def check(
         self, card: BasicCard | ClozeCard | TypeInCard, strictness: str
     ) -> list[ValidationResult]:
@@ -51,7 +81,7 @@ class AnswerLengthRule(ValidationRule):
                         "Consider splitting into multiple cards following "
                         "the minimum information principle."
                     ),
-                    field="back",
+                    field=CardField.BACK,
                 )
             ]
         return []
@@ -60,13 +90,18 @@ class AnswerLengthRule(ValidationRule):
 class MinimumInformationRule(ValidationRule):
     """Detect cards asking multiple questions (violates minimum information principle)."""
 
+    max_severity = ValidationSeverity.WARNING
+
     def check(
         self, card: BasicCard | ClozeCard | TypeInCard, strictness: str
     ) -> list[ValidationResult]:
         """Check for multiple concepts in one card."""
         if isinstance(card, ClozeCard):
-            # Check number of cloze deletions
-            clozes = re.findall(r"\{\{c\d+::", card.text)
+            # count() is a cheap upper bound on well-formed deletions; the
+            # precise scan only runs when a violation is possible
+            if card.text.count("{{c") <= 3:
+                return []
+            clozes = find_cloze_numbers(card.text)
             if len(clozes) > 3:
                 return [
                     ValidationResult(
@@ -74,7 +109,7 @@ class MinimumInformationRule(ValidationRule):
                         rule="minimum_information",
                         message=f"Card has {len(clozes)} cloze deletions. "
                         f"Consider splitting into separate cards for better retention.",
-                        field="text",
+                        field=CardField.TEXT,
                     )
                 ]
             return []
@@ -82,16 +117,7 @@ class MinimumInformationRule(ValidationRule):
         # For basic/type-in cards, look for multiple questions or lists
         # Strip HTML to check actual content
         front = strip_html(card.front).lower()
-        triggers = [
-            ("list", "enumerate"),  # List prompts
-            ("and", ","),  # Multiple items
-            ("or",),  # Multiple choices
-        ]
-
-        found_triggers = []
-        for trigger_group in triggers:
-            if any(t in front for t in trigger_group):
-                found_triggers.extend([t for t in trigger_group if t in front])
+        found_triggers = set(_MULTI_TRIGGER_RE.findall(front))
 
         if len(found_triggers) >= 2:
             severity = (
@@ -105,7 +131,7 @@ class MinimumInformationRule(ValidationRule):
                     rule="minimum_information",
                     message="Front may contain multiple questions or list requests. "
                     "One concept per card improves retention.",
-                    field="front",
+                    field=CardField.FRONT,
                 )
             ]
         return []
@@ -123,28 +149,20 @@ class AmbiguityRule(ValidationRule):
 
         # Check for vague question patterns (strip HTML first)
         front_lower = strip_html(card.front).lower()
-        vague_patterns = [
-            "what about",
-            "tell me about",
-            "describe",
-            "explain everything",
-            "what do you know",
-        ]
-
-        for pattern in vague_patterns:
-            if pattern in front_lower:
-                return [
-                    ValidationResult(
-                        severity=ValidationSeverity.SUGGESTION,
-                        rule="ambiguity",
-                        message=(
-                            f"Question contains '{pattern}' which may be too vague. "
-                            "Be more specific (e.g., 'What is the function of...' "
-                            "instead of 'What about...')."
-                        ),
-                        field="front",
-                    )
-                ]
+        match = _VAGUE_RE.search(front_lower)
+        if match:
+            return [
+                ValidationResult(
+                    severity=ValidationSeverity.SUGGESTION,
+                    rule="ambiguity",
+                    message=(
+                        f"Question contains '{match.group(1)}' which may be too vague. "
+                        "Be more specific (e.g., 'What is the function of...' "
+                        "instead of 'What about...')."
+                    ),
+                    field=CardField.FRONT,
+                )
+            ]
 
         # Check if question is too short (might be incomplete)
         # Use plain text length to exclude HTML tags
@@ -157,7 +175,7 @@ class AmbiguityRule(ValidationRule):
                         "Question is very short. "
                         "Ensure it provides enough context for standalone understanding."
                     ),
-                    field="front",
+                    field=CardField.FRONT,
                 )
             ]
 
@@ -167,6 +185,8 @@ class AmbiguityRule(ValidationRule):
 class ClozeCountRule(ValidationRule):
     """Warn if too many cloze deletions in one card."""
 
+    max_severity = ValidationSeverity.WARNING
+
     def check(
         self, card: BasicCard | ClozeCard | TypeInCard, strictness: str
     ) -> list[ValidationResult]:
@@ -174,9 +194,14 @@ class ClozeCountRule(ValidationRule):
         if not isinstance(card, ClozeCard):
             return []
 
-        clozes = re.findall(r"\{\{c\d+::", card.text)
         max_clozes = {"strict": 2, "moderate": 3, "lenient": 5}[strictness]
 
+        # count() is a cheap upper bound on well-formed deletions; the
+        # precise scan only runs when a violation is possible
+        if card.text.count("{{c") <= max_clozes:
+            return []
+
+        clozes = find_cloze_numbers(card.text)
         if len(clozes) > max_clozes:
             return [
                 ValidationResult(
@@ -188,7 +213,7 @@ class ClozeCountRule(ValidationRule):
                         "Too many deletions make cards difficult and violate "
                         "minimum information principle."
                     ),
-                    field="text",
+                    field=CardField.TEXT,
                 )
             ]
         return []
@@ -197,6 +222,8 @@ class ClozeCountRule(ValidationRule):
 class ClozeFormatRule(ValidationRule):
     """Validate cloze deletion format."""
 
+    max_severity = ValidationSeverity.ERROR
+
     def check(
         self, card: BasicCard | ClozeCard | TypeInCard, strictness: str
     ) -> list[ValidationResult]:
@@ -205,7 +232,7 @@ class ClozeFormatRule(ValidationRule):
             return []
 
         # Check if there are any cloze deletions at all
-        if not re.search(r"\{\{c\d+::", card.text):
+        if not find_cloze_numbers(card.text):
             return [
                 ValidationResult(
                     severity=ValidationSeverity.ERROR,
@@ -214,12 +241,12 @@ class ClozeFormatRule(ValidationRule):
                         "Cloze card must contain at least one cloze deletion "
                         "in {{c1::text}} format."
                     ),
-                    field="text",
+                    field=CardField.TEXT,
                 )
             ]
 
         # Check for malformed cloze deletions
-        malformed = re.findall(r"\{\{[^c]|c\d+:[^:]|\{\{c\d+:[^\}]*$", card.text)
+        malformed = _MALFORMED_CLOZE_RE.findall(card.text)
         if malformed:
             return [
                 ValidationResult(
@@ -229,7 +256,7 @@ class ClozeFormatRule(ValidationRule):
                         "Malformed cloze deletion. "
                         "Use format: {{c1::text}} or {{c1::text::hint}}"
                     ),
-                    field="text",
+                    field=CardField.TEXT,
                 )
             ]
 
@@ -246,7 +273,7 @@ class ContextRule(ValidationRule):
         if isinstance(card, ClozeCard):
             # For cloze cards, check if text is too short
             # Strip both HTML and cloze syntax
-            plain_text = strip_html(card.text.replace("{{", "").replace("}}", ""))
+            plain_text = strip_html(card.text.translate(_BRACE_TRANS))
             if len(plain_text.strip()) < 20:
                 return [
                     ValidationResult(
@@ -256,7 +283,7 @@ class ContextRule(ValidationRule):
                             "Cloze text is very short. "
                             "Consider adding context for standalone understanding."
                         ),
-                        field="text",
+                        field=CardField.TEXT,
                     )
                 ]
             return []
@@ -270,7 +297,7 @@ class ContextRule(ValidationRule):
                     rule="context",
                     message="Question lacks context. Add details for standalone comprehension "
                     "(e.g., 'Capital of France?' instead of 'France').",
-                    field="front",
+                    field=CardField.FRONT,
                 )
             ]
 